@@ -61,6 +61,8 @@ class DomainPersistenceService:
         Returns:
             Persisted DomainModel
         """
+        domain.load_pending_sections()
+
         with self._session_manager.session_scope() as session:
             # Check if domain already exists
             existing = self._domain_repo.get_by_name(session, domain.name)
@@ -5,11 +5,20 @@ Base class for all knowledge domains.
 Each domain maintains META 50/50 equilibrium in its structure.
 """
 
+import contextlib
+import functools
+import itertools
+import os
+import sys
+import threading
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, TypeVar
+from typing import Any, NoReturn, TypeVar
 from uuid import UUID, uuid4
 
 from core.equilibrium import MetaEquilibrium
@@ -18,6 +27,28 @@ from models.domain import Domain, DomainType
 T = TypeVar("T")
 
 
+# Concept and relation ids only need to be unique, not random: a per-process
+# random high half plus a counter in the low half avoids an os.urandom() call
+# per id while staying unique across processes sharing the database.
+_id_base = 0
+_id_counter = itertools.count(1)
+
+
+def _reseed_ids() -> None:
+    global _id_base
+    _id_base = int.from_bytes(os.urandom(8), "big") << 64
+
+
+_reseed_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_ids)
+
+
+def _new_id() -> UUID:
+    """Get a fresh, process-unique id for a concept or relation."""
+    return UUID(int=_id_base | next(_id_counter))
+
+
 class ConceptType(Enum):
     """Types of concepts within a domain."""
 
@@ -44,14 +75,14 @@ class RelationType(Enum):
     EQUIVALENT = "equivalent"
 
 
-@dataclass
+@dataclass(slots=True)
 class Concept:
     """
     A concept within a knowledge domain.
     Concepts maintain balance between certainty and uncertainty.
     """
 
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=_new_id)
     name: str = ""
     concept_type: ConceptType = ConceptType.DEFINITION
     description: str = ""
@@ -60,15 +91,25 @@ class Concept:
     domain_id: UUID | None = None
     created_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
+    _meta: MetaEquilibrium | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self._meta = MetaEquilibrium()
-        # Ensure certainty + uncertainty = 100
+        # Store floats even when given ints (e.g. certainty=80)
+        self.certainty = float(self.certainty)
+        self.uncertainty = float(self.uncertainty)
+        # Ensure certainty + uncertainty = 100 (already true for most callers)
         total = self.certainty + self.uncertainty
-        if total > 0:
+        if total > 0 and total != 100.0:
             self.certainty = self.certainty / total * 100
             self.uncertainty = self.uncertainty / total * 100
 
+    @property
+    def meta(self) -> MetaEquilibrium:
+        """Get the concept's MetaEquilibrium, created on first access."""
+        if self._meta is None:
+            self._meta = MetaEquilibrium()
+        return self._meta
+
     @property
     def is_balanced(self) -> bool:
         """Check if certainty/uncertainty is balanced."""
@@ -85,25 +126,164 @@ class Concept:
         self.uncertainty = 100 - self.certainty
 
 
-@dataclass
+@dataclass(slots=True)
 class ConceptRelation:
     """Relationship between two concepts."""
 
-    id: UUID = field(default_factory=uuid4)
-    source_id: UUID = field(default_factory=uuid4)
-    target_id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=_new_id)
+    source_id: UUID = field(default_factory=_new_id)
+    target_id: UUID = field(default_factory=_new_id)
     relation_type: RelationType = RelationType.DERIVES_FROM
     strength: float = 50.0  # Relationship strength (0-100)
     bidirectional: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+# A ``(name, concept_type, description, metadata)`` row for create_concepts().
+ConceptSpec = tuple[str, ConceptType, str, Mapping[str, Any] | None]
+
+
+class _FrozenDict(dict[str, Any]):
+    """
+    A ``dict`` that rejects changes.
+
+    Still a real dict, so ``json.dumps`` and ``isinstance(value, dict)`` checks
+    (e.g. in the output formatters) keep working; copies are plain dicts.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[dict[str, Any]]]:
+        return dict, (dict(self),)
+
+
+def frozen_mapping(data: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Get a read-only copy of ``data`` with nested mappings frozen as well.
+
+    Used for constant lookup tables and demonstrations that are built once at
+    import and shared by every caller. The copy is a ``dict`` subclass, so it
+    serializes to JSON and formats like any other dict.
+    """
+    return _FrozenDict(
+        (key, frozen_mapping(value) if isinstance(value, Mapping) else value)
+        for key, value in data.items()
+    )
+
+
+def _concept_metadata(metadata: Mapping[str, Any] | None) -> dict[str, Any]:
+    """
+    Copy spec ``metadata`` onto a new concept.
+
+    Spec tables store sequences as tuples so they can be shared; each concept
+    gets its own lists, as concepts built before the tables were hoisted did.
+    """
+    if not metadata:
+        return {}
+    return {
+        key: list(value) if isinstance(value, tuple) else value for key, value in metadata.items()
+    }
+
+
+def expand_duality_pairs(
+    pairs: Iterable[tuple[str, str, str]], suffix: str | None = None
+) -> tuple[tuple[str, str, str, str], ...]:
+    """
+    Expand ``(positive, negative, "X vs Y")`` rows into ready-to-use pair rows.
+
+    Each row becomes ``(positive_name, negative_name, positive_description,
+    negative_description)``: the ``"Name (suffix)"`` names (plain ``"Name"``
+    when ``suffix`` is None) and the pole descriptions are built and interned
+    once, so pair tables can be expanded at module import instead of on every
+    domain construction.
+    """
+    tag = f" ({suffix})" if suffix else ""
+    rows = []
+    for positive, negative, description in pairs:
+        positive_pole, negative_pole = description.split(" vs ", 1)
+        rows.append(
+            (
+                sys.intern(positive + tag),
+                sys.intern(negative + tag),
+                sys.intern("Positive pole: " + positive_pole),
+                sys.intern("Negative pole: " + negative_pole),
+            )
+        )
+    return tuple(rows)
+
+
+# Stands in for ``KnowledgeDomain._lock`` outside parallel loads
+_NO_LOCK = contextlib.nullcontext()
+
+# Per-thread list of the concepts a section adds while sections load in
+# parallel, so ``load_sections`` can put them back in declared order
+_parallel_section = threading.local()
+
+
+def _run_parallel_section(initializer: Callable[[], None]) -> list[Concept]:
+    """Run one section on a worker thread and return the concepts it added."""
+    added: list[Concept] = []
+    _parallel_section.added = added
+    try:
+        initializer()
+    finally:
+        del _parallel_section.added
+    return added
+
+
+def section(method: Callable[[Any], None]) -> Callable[[Any], None]:
+    """
+    Mark an ``initialize_*`` method as a run-once content section.
+
+    The first call loads the section's content; later calls are no-ops, so a
+    section may be loaded eagerly, lazily, or both without duplicating concepts.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "KnowledgeDomain") -> None:
+        if name in self._loaded_sections:
+            return
+        self._loaded_sections.add(name)
+        self._pending_sections.pop(name, None)
+        method(self)
+
+    return wrapper
+
+
 class KnowledgeDomain(ABC):
     """
     Abstract base class for knowledge domains.
     All domains must define their fundamental duality and maintain META 50/50.
     """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_type",
+        "_description",
+        "_meta",
+        "_domain",
+        "_concepts",
+        "_relations",
+        "_axioms",
+        "_name_index",
+        "_adjacency",
+        "_relation_keys",
+        "_type_counts",
+        "_lock",
+        "_pending_sections",
+        "_loaded_sections",
+        # Keep domains weak-referenceable, also for subclasses with empty slots
+        "__weakref__",
+    )
+
     def __init__(
         self,
         name: str,
@@ -124,6 +304,23 @@ class KnowledgeDomain(ABC):
         self._concepts: dict[UUID, Concept] = {}
         self._relations: dict[UUID, ConceptRelation] = {}
         self._axioms: list[Concept] = []
+        # Lowercased name -> first concept added under that name
+        self._name_index: dict[str, Concept] = {}
+        # Concept id -> ids of the relations it takes part in, in insertion order
+        self._adjacency: dict[UUID, list[UUID]] = {}
+        # (source, target, type, bidirectional) -> stored relation, to reject
+        # duplicate edges; bidirectional edges are keyed with their ends sorted
+        self._relation_keys: dict[tuple[UUID, UUID, RelationType, bool], ConceptRelation] = {}
+        # Concept type -> number of concepts of that type
+        self._type_counts: Counter[ConceptType] = Counter()
+
+        # Guards storage updates while ``load_sections(parallel=True)`` runs;
+        # None otherwise, so domains stay cheap to fill, copy and pickle
+        self._lock: threading.RLock | None = None
+
+        # Content sections (see ``section``) deferred until first read
+        self._pending_sections: dict[str, Callable[[], None]] = {}
+        self._loaded_sections: set[str] = set()
 
         # Initialize domain-specific content
         self._initialize_duality()
@@ -151,10 +348,12 @@ class KnowledgeDomain(ABC):
 
     @property
     def concept_count(self) -> int:
+        self.load_pending_sections()
         return len(self._concepts)
 
     @property
     def axiom_count(self) -> int:
+        self.load_pending_sections()
         return len(self._axioms)
 
     @abstractmethod
@@ -172,50 +371,227 @@ class KnowledgeDomain(ABC):
         """Get list of fundamental concept names for this domain."""
         pass
 
+    def load_sections(
+        self,
+        initializers: Iterable[Callable[[], None]],
+        lazy: bool = False,
+        parallel: bool = False,
+    ) -> None:
+        """
+        Load content sections now, or defer them until content is first read.
+
+        Args:
+            initializers: Bound ``initialize_*`` methods to run
+            lazy: If True, register the sections and load them on first access
+            parallel: If True, run the sections concurrently on a thread pool.
+                Sections must not depend on each other. Concepts, axioms and
+                name lookups end up as after a serial load; only the order of
+                relations depends on thread timing.
+
+        Raises:
+            ValueError: If both ``lazy`` and ``parallel`` are set
+        """
+        if lazy and parallel:
+            raise ValueError("Sections cannot be loaded both lazily and in parallel")
+        initializers = list(initializers)
+        if lazy:
+            for initializer in initializers:
+                self._pending_sections[initializer.__name__] = initializer
+        elif parallel and len(initializers) > 1:
+            indexed = set(self._name_index)
+            axiom_count = len(self._axioms)
+            self._lock = threading.RLock()
+            try:
+                with ThreadPoolExecutor(max_workers=len(initializers)) as executor:
+                    futures = [
+                        executor.submit(_run_parallel_section, initializer)
+                        for initializer in initializers
+                    ]
+                    added = [concept for future in futures for concept in future.result()]
+            finally:
+                self._lock = None
+            # Re-register the new concepts section by section, in declared
+            # order, so the first concept under a shared name wins as it would
+            # in a serial load.
+            for concept in added:
+                self._concepts[concept.id] = self._concepts.pop(concept.id)
+                if concept.name.lower() not in indexed:
+                    self._name_index.pop(concept.name.lower(), None)
+            for concept in added:
+                self._name_index.setdefault(concept.name.lower(), concept)
+            self._axioms[axiom_count:] = [c for c in added if c.concept_type == ConceptType.AXIOM]
+        else:
+            for initializer in initializers:
+                initializer()
+
+    def load_pending_sections(self) -> None:
+        """Load any sections deferred by ``load_sections(..., lazy=True)``."""
+        while self._pending_sections:
+            name = next(iter(self._pending_sections))
+            self._pending_sections.pop(name)()
+
     def add_concept(self, concept: Concept) -> None:
         """Add a concept to the domain."""
         concept.domain_id = self._id
-        self._concepts[concept.id] = concept
-        if concept.concept_type == ConceptType.AXIOM:
-            self._axioms.append(concept)
+        added = getattr(_parallel_section, "added", None)
+        if added is not None:
+            added.append(concept)
+        with self._lock or _NO_LOCK:
+            self._concepts[concept.id] = concept
+            self._name_index.setdefault(concept.name.lower(), concept)
+            self._type_counts[concept.concept_type] += 1
+            if concept.concept_type == ConceptType.AXIOM:
+                self._axioms.append(concept)
+
+    def add_concepts(self, concepts: Iterable[Concept]) -> list[Concept]:
+        """
+        Add several concepts in one pass.
+
+        Args:
+            concepts: Concepts to add
+
+        Returns:
+            The added concepts, in order
+        """
+        added = list(concepts)
+        for concept in added:
+            concept.domain_id = self._id
+        section_added = getattr(_parallel_section, "added", None)
+        if section_added is not None:
+            section_added.extend(added)
+        with self._lock or _NO_LOCK:
+            self._concepts.update((concept.id, concept) for concept in added)
+            for concept in added:
+                self._name_index.setdefault(concept.name.lower(), concept)
+            self._type_counts.update(concept.concept_type for concept in added)
+            self._axioms.extend(c for c in added if c.concept_type == ConceptType.AXIOM)
+        return added
 
     def get_concept(self, concept_id: UUID) -> Concept | None:
         """Get a concept by ID."""
+        self.load_pending_sections()
         return self._concepts.get(concept_id)
 
     def get_concept_by_name(self, name: str) -> Concept | None:
-        """Get a concept by name."""
-        for concept in self._concepts.values():
-            if concept.name.lower() == name.lower():
-                return concept
+        """Get a concept by name, loading deferred sections on a miss."""
+        concept = self._name_index.get(name.lower())
+        if concept is not None:
+            return concept
+        if self._pending_sections:
+            self.load_pending_sections()
+            return self.get_concept_by_name(name)
         return None
 
-    def add_relation(self, relation: ConceptRelation) -> None:
-        """Add a relation between concepts."""
+    def add_relation(self, relation: ConceptRelation) -> bool:
+        """
+        Add a relation between concepts.
+
+        A relation with the same source, target, type and directionality as
+        one already in the domain is ignored; for bidirectional relations the
+        order of the ends does not matter.
+
+        Returns:
+            True if the relation was added
+        """
+        with self._lock or _NO_LOCK:
+            return self._store_relation(relation) is relation
+
+    def _store_relation(self, relation: ConceptRelation) -> ConceptRelation:
+        """
+        Store ``relation`` and index it under both concepts (caller holds the lock).
+
+        Returns:
+            ``relation``, or the equivalent relation already stored, in which
+            case ``relation`` is dropped
+        """
+        source_id, target_id = relation.source_id, relation.target_id
+        if relation.bidirectional and target_id < source_id:
+            source_id, target_id = target_id, source_id
+        key = (source_id, target_id, relation.relation_type, relation.bidirectional)
+        existing = self._relation_keys.get(key)
+        if existing is not None:
+            return existing
+        self._relation_keys[key] = relation
         self._relations[relation.id] = relation
+        self._adjacency.setdefault(source_id, []).append(relation.id)
+        if target_id != source_id:
+            self._adjacency.setdefault(target_id, []).append(relation.id)
+        return relation
+
+    def add_relations(self, relations: Iterable[ConceptRelation]) -> list[ConceptRelation]:
+        """
+        Add several relations in one pass.
+
+        Args:
+            relations: Relations to add
+
+        Returns:
+            The added relations, in order, without any duplicates that were skipped
+        """
+        with self._lock or _NO_LOCK:
+            return [
+                relation for relation in relations if self._store_relation(relation) is relation
+            ]
 
     def get_relations(self, concept_id: UUID) -> list[ConceptRelation]:
         """Get all relations involving a concept."""
-        return [
-            r
-            for r in self._relations.values()
-            if r.source_id == concept_id or r.target_id == concept_id
-        ]
+        self.load_pending_sections()
+        relations = self._relations
+        return [relations[relation_id] for relation_id in self._adjacency.get(concept_id, ())]
 
     def create_concept(
-        self, name: str, concept_type: ConceptType, description: str = "", certainty: float = 50.0
+        self,
+        name: str,
+        concept_type: ConceptType,
+        description: str = "",
+        certainty: float = 50.0,
+        metadata: Mapping[str, Any] | None = None,
     ) -> Concept:
-        """Create and add a concept."""
+        """Create and add a concept. ``metadata`` is copied onto the concept."""
         concept = Concept(
             name=name,
             concept_type=concept_type,
             description=description,
             certainty=certainty,
             uncertainty=100 - certainty,
+            metadata=_concept_metadata(metadata),
         )
         self.add_concept(concept)
         return concept
 
+    def create_concepts(
+        self,
+        specs: Iterable[ConceptSpec],
+        certainty: float = 50.0,
+    ) -> list[Concept]:
+        """
+        Create and add several concepts in one pass.
+
+        Args:
+            specs: ``(name, concept_type, description, metadata)`` rows;
+                ``metadata`` is copied onto each concept
+            certainty: Certainty of every concept created
+
+        Returns:
+            The created concepts, in order; they share one ``created_at``
+        """
+        uncertainty = 100 - certainty
+        created_at = datetime.now()
+        return self.add_concepts(
+            [
+                Concept(
+                    name=name,
+                    concept_type=concept_type,
+                    description=description,
+                    certainty=certainty,
+                    uncertainty=uncertainty,
+                    created_at=created_at,
+                    metadata=_concept_metadata(metadata),
+                )
+                for name, concept_type, description, metadata in specs
+            ]
+        )
+
     def create_relation(
         self,
         source: Concept | UUID,
@@ -223,15 +599,84 @@ class KnowledgeDomain(ABC):
         relation_type: RelationType,
         strength: float = 50.0,
     ) -> ConceptRelation:
-        """Create and add a relation."""
+        """
+        Create and add a relation.
+
+        Returns:
+            The new relation, or the equivalent relation already in the domain
+            if this edge is a duplicate (see ``add_relation``)
+        """
         source_id = source.id if isinstance(source, Concept) else source
         target_id = target.id if isinstance(target, Concept) else target
 
         relation = ConceptRelation(
             source_id=source_id, target_id=target_id, relation_type=relation_type, strength=strength
         )
-        self.add_relation(relation)
-        return relation
+        with self._lock or _NO_LOCK:
+            return self._store_relation(relation)
+
+    def create_relations(
+        self,
+        edges: Iterable[tuple[Concept | UUID, Concept | UUID]],
+        relation_type: RelationType,
+        strength: float = 50.0,
+    ) -> list[ConceptRelation]:
+        """
+        Create and add one relation per ``(source, target)`` edge in one pass.
+
+        Args:
+            edges: Source and target concepts (or their ids)
+            relation_type: Type of every relation created
+            strength: Strength of every relation created
+
+        Returns:
+            The added relations, in order, without duplicates of existing relations
+        """
+        return self.add_relations(
+            ConceptRelation(
+                source_id=source.id if isinstance(source, Concept) else source,
+                target_id=target.id if isinstance(target, Concept) else target,
+                relation_type=relation_type,
+                strength=strength,
+            )
+            for source, target in edges
+        )
+
+    def create_duality_pairs(
+        self,
+        pairs: Iterable[tuple[str, str, str, str]],
+        relation_type: RelationType = RelationType.CONTRADICTS,
+        strength: float = 50.0,
+    ) -> list[tuple[Concept, Concept]]:
+        """
+        Create several dualities in one pass.
+
+        Args:
+            pairs: Rows as produced by ``expand_duality_pairs()``
+            relation_type: Relation from each positive to its negative pole
+            strength: Relation strength (50 keeps the pairs balanced)
+
+        Returns:
+            List of (positive concept, negative concept) tuples, in order
+        """
+        poles = [
+            (
+                Concept(
+                    name=positive_name,
+                    concept_type=ConceptType.DEFINITION,
+                    description=positive_description,
+                ),
+                Concept(
+                    name=negative_name,
+                    concept_type=ConceptType.DEFINITION,
+                    description=negative_description,
+                ),
+            )
+            for positive_name, negative_name, positive_description, negative_description in pairs
+        ]
+        self.add_concepts(concept for pair in poles for concept in pair)
+        self.create_relations(poles, relation_type, strength)
+        return poles
 
     def validate_balance(self) -> bool:
         """Validate domain maintains META 50/50."""
@@ -241,11 +686,10 @@ class KnowledgeDomain(ABC):
 
     def get_domain_stats(self) -> dict[str, Any]:
         """Get domain statistics."""
-        concepts_by_type: dict[str, int] = {}
-        for concept in self._concepts.values():
-            t = concept.concept_type.value
-            concepts_by_type[t] = concepts_by_type.get(t, 0) + 1
-
+        self.load_pending_sections()
+        # Certainty can change through Concept.adjust_certainty() without the
+        # domain seeing it, so the average is computed here rather than kept
+        # as a running sum like the type counts.
         avg_certainty = 0.0
         if self._concepts:
             avg_certainty = sum(c.certainty for c in self._concepts.values()) / len(self._concepts)
@@ -256,7 +700,7 @@ class KnowledgeDomain(ABC):
             "concepts": self.concept_count,
             "axioms": self.axiom_count,
             "relations": len(self._relations),
-            "concepts_by_type": concepts_by_type,
+            "concepts_by_type": {t.value: n for t, n in self._type_counts.items()},
             "average_certainty": avg_certainty,
             "balanced": self.validate_balance(),
         }
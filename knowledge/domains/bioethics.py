@@ -5,16 +5,155 @@ Bioethics knowledge domain with META 50/50 equilibrium.
 Fundamental duality: Life/Choice (sanctity vs autonomy).
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from core.equilibrium import MetaEquilibrium
 from knowledge.domains.base import (
+    ConceptSpec,
     ConceptType,
     KnowledgeDomain,
-    RelationType,
+    expand_duality_pairs,
+    frozen_mapping,
 )
 from models.domain import DomainType
 
+_BIOETHICS_PRINCIPLES: tuple[ConceptSpec, ...] = tuple(
+    (name, ConceptType.PRINCIPLE, description, None)
+    for name, description in (
+        ("Respect for Autonomy", "Honor individual self-determination"),
+        ("Beneficence", "Act for patient's benefit"),
+        ("Non-maleficence", "Do no harm"),
+        ("Justice", "Fair distribution of benefits and burdens"),
+        ("Informed Consent", "Voluntary agreement with understanding"),
+        ("Dignity", "Respect inherent human worth"),
+        ("Vulnerability", "Protect those who cannot protect themselves"),
+        ("Solidarity", "Support for collective well-being"),
+    )
+)
+
+_BIOETHICS_BRANCHES: tuple[ConceptSpec, ...] = tuple(
+    (name, concept_type, description, None)
+    for name, description, concept_type in (
+        ("Medical Ethics", "Clinical practice ethics", ConceptType.THEORY),
+        ("Research Ethics", "Human subjects research", ConceptType.THEORY),
+        ("Clinical Ethics", "Bedside decisions", ConceptType.THEORY),
+        ("Public Health Ethics", "Population-level ethics", ConceptType.THEORY),
+        ("Neuroethics", "Brain and behavior ethics", ConceptType.THEORY),
+        ("Environmental Ethics", "Nature and ecology ethics", ConceptType.THEORY),
+        ("Animal Ethics", "Non-human animal welfare", ConceptType.THEORY),
+        ("Reproductive Ethics", "Reproduction and genetics", ConceptType.THEORY),
+        ("End-of-Life Ethics", "Death and dying", ConceptType.THEORY),
+        ("Global Bioethics", "International perspectives", ConceptType.THEORY),
+    )
+)
+
+_BIOETHICS_ISSUES: tuple[ConceptSpec, ...] = tuple(
+    (name, ConceptType.DEFINITION, description, MappingProxyType({"category": category}))
+    for name, description, category in (
+        ("Euthanasia", "Assisted dying", "End-of-life"),
+        ("Abortion", "Pregnancy termination", "Reproductive"),
+        ("Genetic Enhancement", "Genetic modification", "Biotechnology"),
+        ("Cloning", "Reproductive cloning", "Biotechnology"),
+        ("Organ Allocation", "Transplant distribution", "Resource"),
+        ("Clinical Trials", "Research participation", "Research"),
+    )
+)
+
+_BIOETHICS_FRAMEWORKS: tuple[ConceptSpec, ...] = tuple(
+    (name, ConceptType.THEORY, description, MappingProxyType({"source": source}))
+    for name, source, description in (
+        ("Principlism", "Beauchamp & Childress", "Four principles approach"),
+        ("Virtue Ethics", "Aristotle", "Character-based"),
+        ("Deontology", "Kant", "Duty-based"),
+        ("Consequentialism", "Mill", "Outcome-based"),
+        ("Care Ethics", "Gilligan", "Relationship-based"),
+        ("Casuistry", "Jonsen", "Case-based reasoning"),
+    )
+)
+
+_BIOETHICS_PAIRS = expand_duality_pairs(
+    (
+        ("Life", "Choice", "Sanctity vs autonomy"),
+        ("Benefit", "Harm", "Good vs bad outcomes"),
+        ("Individual", "Society", "Person vs collective"),
+        ("Natural", "Artificial", "Given vs made"),
+        ("Rights", "Duties", "Entitlements vs obligations"),
+        ("Autonomy", "Paternalism", "Self-rule vs protection"),
+        ("Privacy", "Transparency", "Hidden vs open"),
+        ("Treatment", "Enhancement", "Cure vs improve"),
+        ("Quality", "Sanctity", "Life quality vs life itself"),
+        ("Present", "Future", "Current vs coming generations"),
+        ("Human", "Non-human", "People vs animals"),
+        ("Research", "Treatment", "Knowledge vs care"),
+        ("Universal", "Cultural", "Global vs local values"),
+        ("Consent", "Override", "Agreement vs exception"),
+        ("Active", "Passive", "Doing vs allowing"),
+        ("Ordinary", "Extraordinary", "Standard vs heroic"),
+        ("Withholding", "Withdrawing", "Not starting vs stopping"),
+        ("Competent", "Incompetent", "Capable vs incapable"),
+        ("Voluntary", "Involuntary", "Willing vs forced"),
+        ("Disclosure", "Concealment", "Telling vs hiding"),
+    ),
+    "Bioethics",
+)
+
+_BIOETHICS_FUNDAMENTALS: tuple[str, ...] = (
+    "Autonomy",
+    "Consent",
+    "Dignity",
+    "Justice",
+    "Harm",
+    "Benefit",
+    "Rights",
+    "Duty",
+    "Life",
+    "Death",
+    "Privacy",
+    "Confidentiality",
+    "Research",
+    "Treatment",
+    "Enhancement",
+)
+
+_BELMONT_PRINCIPLES = frozen_mapping(
+    {
+        "respect_for_persons": "Autonomy and protection of vulnerable",
+        "beneficence": "Maximize benefits, minimize harms",
+        "justice": "Fair selection and distribution",
+    }
+)
+
+_BIOETHICS_BALANCE = frozen_mapping(
+    {
+        "concept": "Bioethics Equilibrium",
+        "dualities": {
+            "life_choice": {
+                "life": 50.0,
+                "choice": 50.0,
+                "meaning": "Sanctity and autonomy both valued",
+            },
+            "benefit_harm": {
+                "benefit": 50.0,
+                "harm": 50.0,
+                "meaning": "Weighing good against bad",
+            },
+            "individual_society": {
+                "individual": 50.0,
+                "society": 50.0,
+                "meaning": "Personal and collective interests",
+            },
+        },
+        "ethical_balance": {
+            "rights": 50.0,
+            "responsibilities": 50.0,
+            "description": "Claims and duties balance",
+        },
+        "meta_meaning": "Bioethics demonstrates META 50/50 in life-choice equilibrium",
+    }
+)
+
 
 class BioethicsDomain(KnowledgeDomain):
     """
@@ -51,245 +190,35 @@ class BioethicsDomain(KnowledgeDomain):
 
     def _initialize_axioms(self) -> None:
         """Initialize fundamental bioethics principles."""
-        principles = [
-            (
-                "Respect for Autonomy",
-                "Honor individual self-determination",
-            ),
-            (
-                "Beneficence",
-                "Act for patient's benefit",
-            ),
-            (
-                "Non-maleficence",
-                "Do no harm",
-            ),
-            (
-                "Justice",
-                "Fair distribution of benefits and burdens",
-            ),
-            (
-                "Informed Consent",
-                "Voluntary agreement with understanding",
-            ),
-            (
-                "Dignity",
-                "Respect inherent human worth",
-            ),
-            (
-                "Vulnerability",
-                "Protect those who cannot protect themselves",
-            ),
-            (
-                "Solidarity",
-                "Support for collective well-being",
-            ),
-        ]
-
-        for name, description in principles:
-            self.create_concept(
-                name=name,
-                concept_type=ConceptType.PRINCIPLE,
-                description=description,
-                certainty=85,
-            )
+        self.create_concepts(_BIOETHICS_PRINCIPLES, certainty=85)
 
     def get_fundamental_concepts(self) -> list[str]:
         """Get fundamental bioethics concepts."""
-        return [
-            "Autonomy",
-            "Consent",
-            "Dignity",
-            "Justice",
-            "Harm",
-            "Benefit",
-            "Rights",
-            "Duty",
-            "Life",
-            "Death",
-            "Privacy",
-            "Confidentiality",
-            "Research",
-            "Treatment",
-            "Enhancement",
-        ]
+        return list(_BIOETHICS_FUNDAMENTALS)
 
     def initialize_branches(self) -> None:
         """Initialize major bioethics branches."""
-        branches = [
-            (
-                "Medical Ethics",
-                "Clinical practice ethics",
-                ConceptType.THEORY,
-            ),
-            (
-                "Research Ethics",
-                "Human subjects research",
-                ConceptType.THEORY,
-            ),
-            (
-                "Clinical Ethics",
-                "Bedside decisions",
-                ConceptType.THEORY,
-            ),
-            (
-                "Public Health Ethics",
-                "Population-level ethics",
-                ConceptType.THEORY,
-            ),
-            (
-                "Neuroethics",
-                "Brain and behavior ethics",
-                ConceptType.THEORY,
-            ),
-            (
-                "Environmental Ethics",
-                "Nature and ecology ethics",
-                ConceptType.THEORY,
-            ),
-            (
-                "Animal Ethics",
-                "Non-human animal welfare",
-                ConceptType.THEORY,
-            ),
-            (
-                "Reproductive Ethics",
-                "Reproduction and genetics",
-                ConceptType.THEORY,
-            ),
-            (
-                "End-of-Life Ethics",
-                "Death and dying",
-                ConceptType.THEORY,
-            ),
-            (
-                "Global Bioethics",
-                "International perspectives",
-                ConceptType.THEORY,
-            ),
-        ]
-
-        for name, description, concept_type in branches:
-            self.create_concept(name, concept_type, description)
+        self.create_concepts(_BIOETHICS_BRANCHES)
 
     def initialize_issues(self) -> None:
         """Initialize major bioethical issues."""
-        issues = [
-            ("Euthanasia", "Assisted dying", "End-of-life"),
-            ("Abortion", "Pregnancy termination", "Reproductive"),
-            ("Genetic Enhancement", "Genetic modification", "Biotechnology"),
-            ("Cloning", "Reproductive cloning", "Biotechnology"),
-            ("Organ Allocation", "Transplant distribution", "Resource"),
-            ("Clinical Trials", "Research participation", "Research"),
-        ]
-
-        for name, description, category in issues:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["category"] = category
+        self.create_concepts(_BIOETHICS_ISSUES)
 
     def initialize_frameworks(self) -> None:
         """Initialize ethical frameworks."""
-        frameworks = [
-            ("Principlism", "Beauchamp & Childress", "Four principles approach"),
-            ("Virtue Ethics", "Aristotle", "Character-based"),
-            ("Deontology", "Kant", "Duty-based"),
-            ("Consequentialism", "Mill", "Outcome-based"),
-            ("Care Ethics", "Gilligan", "Relationship-based"),
-            ("Casuistry", "Jonsen", "Case-based reasoning"),
-        ]
-
-        for name, source, description in frameworks:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.THEORY,
-                description=description,
-            )
-            concept.metadata["source"] = source
+        self.create_concepts(_BIOETHICS_FRAMEWORKS)
 
     def initialize_bioethics_pairs(self) -> None:
         """Initialize fundamental bioethics pairs with META 50/50 balance."""
-        pairs = [
-            ("Life", "Choice", "Sanctity vs autonomy"),
-            ("Benefit", "Harm", "Good vs bad outcomes"),
-            ("Individual", "Society", "Person vs collective"),
-            ("Natural", "Artificial", "Given vs made"),
-            ("Rights", "Duties", "Entitlements vs obligations"),
-            ("Autonomy", "Paternalism", "Self-rule vs protection"),
-            ("Privacy", "Transparency", "Hidden vs open"),
-            ("Treatment", "Enhancement", "Cure vs improve"),
-            ("Quality", "Sanctity", "Life quality vs life itself"),
-            ("Present", "Future", "Current vs coming generations"),
-            ("Human", "Non-human", "People vs animals"),
-            ("Research", "Treatment", "Knowledge vs care"),
-            ("Universal", "Cultural", "Global vs local values"),
-            ("Consent", "Override", "Agreement vs exception"),
-            ("Active", "Passive", "Doing vs allowing"),
-            ("Ordinary", "Extraordinary", "Standard vs heroic"),
-            ("Withholding", "Withdrawing", "Not starting vs stopping"),
-            ("Competent", "Incompetent", "Capable vs incapable"),
-            ("Voluntary", "Involuntary", "Willing vs forced"),
-            ("Disclosure", "Concealment", "Telling vs hiding"),
-        ]
-
-        for positive, negative, description in pairs:
-            pos_concept = self.create_concept(
-                name=f"{positive} (Bioethics)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Positive pole: {description.split(' vs ')[0]}",
-            )
-            neg_concept = self.create_concept(
-                name=f"{negative} (Bioethics)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Negative pole: {description.split(' vs ')[1]}",
-            )
+        self.create_duality_pairs(_BIOETHICS_PAIRS)
 
-            self.create_relation(
-                pos_concept,
-                neg_concept,
-                RelationType.CONTRADICTS,
-                strength=50,
-            )
-
-    def get_belmont_principles(self) -> dict[str, str]:
+    def get_belmont_principles(self) -> Mapping[str, str]:
         """Get Belmont Report principles."""
-        return {
-            "respect_for_persons": "Autonomy and protection of vulnerable",
-            "beneficence": "Maximize benefits, minimize harms",
-            "justice": "Fair selection and distribution",
-        }
+        return _BELMONT_PRINCIPLES
 
-    def demonstrate_bioethics_balance(self) -> dict[str, Any]:
+    def demonstrate_bioethics_balance(self) -> Mapping[str, Any]:
         """Demonstrate bioethics balance principles."""
-        return {
-            "concept": "Bioethics Equilibrium",
-            "dualities": {
-                "life_choice": {
-                    "life": 50.0,
-                    "choice": 50.0,
-                    "meaning": "Sanctity and autonomy both valued",
-                },
-                "benefit_harm": {
-                    "benefit": 50.0,
-                    "harm": 50.0,
-                    "meaning": "Weighing good against bad",
-                },
-                "individual_society": {
-                    "individual": 50.0,
-                    "society": 50.0,
-                    "meaning": "Personal and collective interests",
-                },
-            },
-            "ethical_balance": {
-                "rights": 50.0,
-                "responsibilities": 50.0,
-                "description": "Claims and duties balance",
-            },
-            "meta_meaning": "Bioethics demonstrates META 50/50 in life-choice equilibrium",
-        }
+        return _BIOETHICS_BALANCE
 
 
 def create_bioethics_domain(
@@ -5,16 +5,254 @@ Life science knowledge domain with META 50/50 equilibrium.
 Fundamental duality: Life/Death (anabolism/catabolism, creation/destruction).
 """
 
+import sys
+from collections.abc import Mapping
+from itertools import product
+from types import MappingProxyType
 from typing import Any
 
 from core.equilibrium import MetaEquilibrium
 from knowledge.domains.base import (
+    ConceptSpec,
     ConceptType,
     KnowledgeDomain,
     RelationType,
+    frozen_mapping,
+    section,
 )
 from models.domain import DomainType
 
+# Standard genetic code as a 64-entry lookup table. A codon is addressed by
+# packing its bases (U/C/A/G -> 0-3) into six bits: (b1 << 4) | (b2 << 2) | b3,
+# so translation is byte arithmetic plus one index per codon. Every other byte
+# (including \x00-\x03 themselves) maps to 0xFF so it fails validation.
+_BASE_INDEX = bytes(b"UCAG".find(byte) & 0xFF for byte in range(256))
+# Codons and the 21 amino-acid names are interned: the genetic code and every
+# translation hand out these same string objects.
+_AMINO_ACIDS: tuple[str, ...] = tuple(
+    map(
+        sys.intern,
+        "Phe Leu Ser Tyr Stop Cys Trp Pro His Gln Arg Ile Met Thr Asn Lys Val Ala Asp Glu Gly".split(),
+    )
+)
+# Index into _AMINO_ACIDS for each packed codon, UUU first and GGG last
+_CODON_TO_AA_ID = bytes(
+    _AMINO_ACIDS.index(name)
+    for name in (
+        "Phe Phe Leu Leu Ser Ser Ser Ser Tyr Tyr Stop Stop Cys Cys Stop Trp "
+        "Leu Leu Leu Leu Pro Pro Pro Pro His His Gln Gln Arg Arg Arg Arg "
+        "Ile Ile Ile Met Thr Thr Thr Thr Asn Asn Lys Lys Ser Ser Arg Arg "
+        "Val Val Val Val Ala Ala Ala Ala Asp Asp Glu Glu Gly Gly Gly Gly"
+    ).split()
+)
+_GENETIC_CODE: Mapping[str, str] = frozen_mapping(
+    {
+        sys.intern("".join(codon)): _AMINO_ACIDS[aa_id]
+        for codon, aa_id in zip(product("UCAG", repeat=3), _CODON_TO_AA_ID, strict=True)
+    }
+)
+
+
+# Concept names are interned at import so the many domains that reuse them
+# (Genetics, Ecology, Bioinformatics, ...) share one string object per name.
+_BIOLOGY_PRINCIPLES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.PRINCIPLE, description, None)
+    for name, description in (
+        (
+            "Cell Theory",
+            "All living organisms are composed of cells; cells are the basic unit of life",
+        ),
+        ("Gene Theory", "Traits are inherited through genes; DNA is the hereditary material"),
+        (
+            "Evolution by Natural Selection",
+            "Species evolve through variation, inheritance, selection, and time",
+        ),
+        (
+            "Homeostasis",
+            "Living systems maintain internal equilibrium despite external changes",
+        ),
+        ("Energy Flow", "Energy flows through ecosystems from producers to consumers"),
+        ("Central Dogma", "Genetic information flows: DNA → RNA → Protein"),
+        ("Biogenesis", "Life arises only from existing life"),
+        ("Unity and Diversity", "All life shares common ancestry yet exhibits vast diversity"),
+    )
+)
+
+_BIOLOGY_BRANCHES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), concept_type, description, None)
+    for name, description, concept_type in (
+        ("Molecular Biology", "Study of biological molecules", ConceptType.THEORY),
+        ("Cell Biology", "Study of cell structure and function", ConceptType.THEORY),
+        ("Genetics", "Study of heredity and variation", ConceptType.THEORY),
+        ("Evolutionary Biology", "Study of evolutionary processes", ConceptType.THEORY),
+        ("Ecology", "Study of organisms and environments", ConceptType.THEORY),
+        ("Physiology", "Study of organism functions", ConceptType.THEORY),
+        ("Anatomy", "Study of organism structure", ConceptType.THEORY),
+        ("Biochemistry", "Chemistry of living systems", ConceptType.THEORY),
+        ("Microbiology", "Study of microorganisms", ConceptType.THEORY),
+        ("Botany", "Study of plants", ConceptType.THEORY),
+        ("Zoology", "Study of animals", ConceptType.THEORY),
+        ("Neuroscience", "Study of the nervous system", ConceptType.THEORY),
+        ("Immunology", "Study of immune systems", ConceptType.THEORY),
+        ("Bioinformatics", "Computational analysis of biological data", ConceptType.THEORY),
+    )
+)
+
+_TAXONOMIC_RANKS: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"examples": examples}),
+    )
+    for name, description, examples in (
+        ("Domain", "Highest taxonomic rank", "Bacteria, Archaea, Eukarya"),
+        ("Kingdom", "Major group of organisms", "Animalia, Plantae, Fungi"),
+        ("Phylum", "Body plan grouping", "Chordata, Arthropoda"),
+        ("Class", "Subdivision of phylum", "Mammalia, Aves, Reptilia"),
+        ("Order", "Subdivision of class", "Primates, Carnivora"),
+        ("Family", "Subdivision of order", "Hominidae, Felidae"),
+        ("Genus", "Group of related species", "Homo, Felis"),
+        ("Species", "Basic unit of classification", "Homo sapiens"),
+    )
+)
+
+_CELL_COMPONENTS: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"found_in": found_in}),
+    )
+    for name, description, found_in in (
+        ("Nucleus", "Contains genetic material (DNA)", "Eukaryotes"),
+        ("Mitochondria", "Produces ATP through cellular respiration", "Eukaryotes"),
+        ("Chloroplast", "Performs photosynthesis", "Plants, algae"),
+        ("Endoplasmic Reticulum", "Protein and lipid synthesis", "Eukaryotes"),
+        ("Golgi Apparatus", "Modifies and packages proteins", "Eukaryotes"),
+        ("Ribosome", "Protein synthesis", "All cells"),
+        ("Cell Membrane", "Controls what enters and exits", "All cells"),
+        ("Cell Wall", "Structural support", "Plants, fungi, bacteria"),
+        ("Lysosome", "Digests cellular waste", "Animal cells"),
+        ("Vacuole", "Storage of materials", "Plant cells"),
+        ("Cytoplasm", "Gel-like fluid filling the cell", "All cells"),
+        ("Cytoskeleton", "Structural support network", "Eukaryotes"),
+    )
+)
+
+_MACROMOLECULES: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"basic_structure": structure, "examples": examples}),
+    )
+    for name, description, structure, examples in (
+        (
+            "Carbohydrates",
+            "Energy storage and structural molecules",
+            "Cn(H2O)n",
+            ("Glucose", "Starch", "Cellulose"),
+        ),
+        (
+            "Proteins",
+            "Enzymes, structural components, signaling",
+            "Amino acid polymers",
+            ("Enzymes", "Antibodies", "Collagen"),
+        ),
+        (
+            "Lipids",
+            "Energy storage, membranes, signaling",
+            "Fatty acids + glycerol",
+            ("Fats", "Phospholipids", "Steroids"),
+        ),
+        (
+            "Nucleic Acids",
+            "Genetic information storage and transfer",
+            "Nucleotide polymers",
+            ("DNA", "RNA"),
+        ),
+    )
+)
+
+_BIOLOGICAL_PROCESSES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.MODEL, description, MappingProxyType({"formula": formula}))
+    for name, description, formula in (
+        (
+            "Photosynthesis",
+            "Convert light energy to chemical energy",
+            "6CO2 + 6H2O → C6H12O6 + 6O2",
+        ),
+        (
+            "Cellular Respiration",
+            "Extract energy from glucose",
+            "C6H12O6 + 6O2 → 6CO2 + 6H2O + ATP",
+        ),
+        ("DNA Replication", "Copy genetic information", "DNA → 2 identical DNA molecules"),
+        ("Transcription", "Copy DNA to RNA", "DNA → mRNA"),
+        ("Translation", "Build proteins from mRNA", "mRNA → Protein"),
+        ("Mitosis", "Cell division for growth", "1 cell → 2 identical cells"),
+        ("Meiosis", "Cell division for reproduction", "1 cell → 4 haploid cells"),
+        ("Apoptosis", "Programmed cell death", "Controlled cellular destruction"),
+    )
+)
+
+_BIOLOGY_FUNDAMENTALS: tuple[str, ...] = (
+    "Cell",
+    "Gene",
+    "Protein",
+    "DNA",
+    "RNA",
+    "Organism",
+    "Species",
+    "Evolution",
+    "Metabolism",
+    "Reproduction",
+    "Ecosystem",
+    "Population",
+    "Adaptation",
+    "Mutation",
+    "Selection",
+)
+
+_BIOLOGY_BALANCE = frozen_mapping(
+    {
+        "concept": "Biological Equilibrium",
+        "dualities": {
+            "anabolism_catabolism": {
+                "anabolism": 50.0,
+                "catabolism": 50.0,
+                "meaning": "Building up and breaking down must balance",
+            },
+            "birth_death": {
+                "birth": 50.0,
+                "death": 50.0,
+                "meaning": "Population equilibrium requires balanced rates",
+            },
+            "predator_prey": {
+                "predator": 50.0,
+                "prey": 50.0,
+                "meaning": "Ecosystem balance through population dynamics",
+            },
+            "production_consumption": {
+                "production": 50.0,
+                "consumption": 50.0,
+                "meaning": "Energy flow maintains ecosystem balance",
+            },
+        },
+        "homeostasis": {
+            "description": "Living systems maintain internal balance",
+            "examples": (
+                "Body temperature regulation",
+                "Blood pH balance",
+                "Blood glucose levels",
+                "Water balance",
+            ),
+        },
+        "meta_meaning": "Life maintains dynamic equilibrium through balanced processes",
+    }
+)
+
 
 class BiologyDomain(KnowledgeDomain):
     """
@@ -51,301 +289,79 @@ class BiologyDomain(KnowledgeDomain):
 
     def _initialize_axioms(self) -> None:
         """Initialize fundamental biological principles as axioms."""
-        principles = [
-            (
-                "Cell Theory",
-                "All living organisms are composed of cells; cells are the basic unit of life",
-            ),
-            ("Gene Theory", "Traits are inherited through genes; DNA is the hereditary material"),
-            (
-                "Evolution by Natural Selection",
-                "Species evolve through variation, inheritance, selection, and time",
-            ),
-            (
-                "Homeostasis",
-                "Living systems maintain internal equilibrium despite external changes",
-            ),
-            ("Energy Flow", "Energy flows through ecosystems from producers to consumers"),
-            ("Central Dogma", "Genetic information flows: DNA → RNA → Protein"),
-            ("Biogenesis", "Life arises only from existing life"),
-            ("Unity and Diversity", "All life shares common ancestry yet exhibits vast diversity"),
-        ]
-
-        for name, description in principles:
-            self.create_concept(
-                name=name,
-                concept_type=ConceptType.PRINCIPLE,
-                description=description,
-                certainty=95,  # High certainty biological principles
-            )
+        self.create_concepts(_BIOLOGY_PRINCIPLES, certainty=95)
 
     def get_fundamental_concepts(self) -> list[str]:
         """Get fundamental biology concepts."""
-        return [
-            "Cell",
-            "Gene",
-            "Protein",
-            "DNA",
-            "RNA",
-            "Organism",
-            "Species",
-            "Evolution",
-            "Metabolism",
-            "Reproduction",
-            "Ecosystem",
-            "Population",
-            "Adaptation",
-            "Mutation",
-            "Selection",
-        ]
+        return list(_BIOLOGY_FUNDAMENTALS)
 
+    @section
     def initialize_branches(self) -> None:
         """Initialize major biology branches."""
-        branches = [
-            ("Molecular Biology", "Study of biological molecules", ConceptType.THEORY),
-            ("Cell Biology", "Study of cell structure and function", ConceptType.THEORY),
-            ("Genetics", "Study of heredity and variation", ConceptType.THEORY),
-            ("Evolutionary Biology", "Study of evolutionary processes", ConceptType.THEORY),
-            ("Ecology", "Study of organisms and environments", ConceptType.THEORY),
-            ("Physiology", "Study of organism functions", ConceptType.THEORY),
-            ("Anatomy", "Study of organism structure", ConceptType.THEORY),
-            ("Biochemistry", "Chemistry of living systems", ConceptType.THEORY),
-            ("Microbiology", "Study of microorganisms", ConceptType.THEORY),
-            ("Botany", "Study of plants", ConceptType.THEORY),
-            ("Zoology", "Study of animals", ConceptType.THEORY),
-            ("Neuroscience", "Study of the nervous system", ConceptType.THEORY),
-            ("Immunology", "Study of immune systems", ConceptType.THEORY),
-            ("Bioinformatics", "Computational analysis of biological data", ConceptType.THEORY),
-        ]
-
-        for name, description, concept_type in branches:
-            self.create_concept(name, concept_type, description)
+        self.create_concepts(_BIOLOGY_BRANCHES)
 
+    @section
     def initialize_taxonomic_ranks(self) -> None:
         """Initialize biological classification hierarchy."""
-        ranks = [
-            ("Domain", "Highest taxonomic rank", "Bacteria, Archaea, Eukarya"),
-            ("Kingdom", "Major group of organisms", "Animalia, Plantae, Fungi"),
-            ("Phylum", "Body plan grouping", "Chordata, Arthropoda"),
-            ("Class", "Subdivision of phylum", "Mammalia, Aves, Reptilia"),
-            ("Order", "Subdivision of class", "Primates, Carnivora"),
-            ("Family", "Subdivision of order", "Hominidae, Felidae"),
-            ("Genus", "Group of related species", "Homo, Felis"),
-            ("Species", "Basic unit of classification", "Homo sapiens"),
-        ]
+        concepts = self.create_concepts(_TAXONOMIC_RANKS)
 
-        concepts = []
-        for name, description, examples in ranks:
-            concept = self.create_concept(
-                name=name, concept_type=ConceptType.DEFINITION, description=description
-            )
-            concept.metadata["examples"] = examples
-            concepts.append(concept)
-
-        # Create hierarchy relations
-        for i in range(len(concepts) - 1):
-            self.create_relation(
-                concepts[i], concepts[i + 1], RelationType.SPECIALIZES, strength=100
-            )
+        # Each rank specializes the one above it
+        self.create_relations(zip(concepts, concepts[1:]), RelationType.SPECIALIZES, strength=100)
 
+    @section
     def initialize_cell_components(self) -> None:
         """Initialize cell structures and organelles."""
-        organelles = [
-            ("Nucleus", "Contains genetic material (DNA)", "Eukaryotes"),
-            ("Mitochondria", "Produces ATP through cellular respiration", "Eukaryotes"),
-            ("Chloroplast", "Performs photosynthesis", "Plants, algae"),
-            ("Endoplasmic Reticulum", "Protein and lipid synthesis", "Eukaryotes"),
-            ("Golgi Apparatus", "Modifies and packages proteins", "Eukaryotes"),
-            ("Ribosome", "Protein synthesis", "All cells"),
-            ("Cell Membrane", "Controls what enters and exits", "All cells"),
-            ("Cell Wall", "Structural support", "Plants, fungi, bacteria"),
-            ("Lysosome", "Digests cellular waste", "Animal cells"),
-            ("Vacuole", "Storage of materials", "Plant cells"),
-            ("Cytoplasm", "Gel-like fluid filling the cell", "All cells"),
-            ("Cytoskeleton", "Structural support network", "Eukaryotes"),
-        ]
-
-        for name, function, found_in in organelles:
-            concept = self.create_concept(
-                name=name, concept_type=ConceptType.DEFINITION, description=function
-            )
-            concept.metadata["found_in"] = found_in
+        self.create_concepts(_CELL_COMPONENTS)
 
+    @section
     def initialize_macromolecules(self) -> None:
         """Initialize biological macromolecules."""
-        molecules = [
-            (
-                "Carbohydrates",
-                "Energy storage and structural molecules",
-                "Cn(H2O)n",
-                ["Glucose", "Starch", "Cellulose"],
-            ),
-            (
-                "Proteins",
-                "Enzymes, structural components, signaling",
-                "Amino acid polymers",
-                ["Enzymes", "Antibodies", "Collagen"],
-            ),
-            (
-                "Lipids",
-                "Energy storage, membranes, signaling",
-                "Fatty acids + glycerol",
-                ["Fats", "Phospholipids", "Steroids"],
-            ),
-            (
-                "Nucleic Acids",
-                "Genetic information storage and transfer",
-                "Nucleotide polymers",
-                ["DNA", "RNA"],
-            ),
-        ]
-
-        for name, function, structure, examples in molecules:
-            concept = self.create_concept(
-                name=name, concept_type=ConceptType.DEFINITION, description=function
-            )
-            concept.metadata.update({"basic_structure": structure, "examples": examples})
+        self.create_concepts(_MACROMOLECULES)
 
+    @section
     def initialize_biological_processes(self) -> None:
         """Initialize key biological processes."""
-        processes = [
-            (
-                "Photosynthesis",
-                "Convert light energy to chemical energy",
-                "6CO2 + 6H2O → C6H12O6 + 6O2",
-            ),
-            (
-                "Cellular Respiration",
-                "Extract energy from glucose",
-                "C6H12O6 + 6O2 → 6CO2 + 6H2O + ATP",
-            ),
-            ("DNA Replication", "Copy genetic information", "DNA → 2 identical DNA molecules"),
-            ("Transcription", "Copy DNA to RNA", "DNA → mRNA"),
-            ("Translation", "Build proteins from mRNA", "mRNA → Protein"),
-            ("Mitosis", "Cell division for growth", "1 cell → 2 identical cells"),
-            ("Meiosis", "Cell division for reproduction", "1 cell → 4 haploid cells"),
-            ("Apoptosis", "Programmed cell death", "Controlled cellular destruction"),
-        ]
+        self.create_concepts(_BIOLOGICAL_PROCESSES)
 
-        for name, description, formula in processes:
-            concept = self.create_concept(
-                name=name, concept_type=ConceptType.MODEL, description=description
-            )
-            concept.metadata["formula"] = formula
-
-    def demonstrate_biological_balance(self) -> dict[str, Any]:
+    def demonstrate_biological_balance(self) -> Mapping[str, Any]:
         """
         Demonstrate biological balance principles.
         Shows META 50/50 in living systems.
         """
-        return {
-            "concept": "Biological Equilibrium",
-            "dualities": {
-                "anabolism_catabolism": {
-                    "anabolism": 50.0,
-                    "catabolism": 50.0,
-                    "meaning": "Building up and breaking down must balance",
-                },
-                "birth_death": {
-                    "birth": 50.0,
-                    "death": 50.0,
-                    "meaning": "Population equilibrium requires balanced rates",
-                },
-                "predator_prey": {
-                    "predator": 50.0,
-                    "prey": 50.0,
-                    "meaning": "Ecosystem balance through population dynamics",
-                },
-                "production_consumption": {
-                    "production": 50.0,
-                    "consumption": 50.0,
-                    "meaning": "Energy flow maintains ecosystem balance",
-                },
-            },
-            "homeostasis": {
-                "description": "Living systems maintain internal balance",
-                "examples": [
-                    "Body temperature regulation",
-                    "Blood pH balance",
-                    "Blood glucose levels",
-                    "Water balance",
-                ],
-            },
-            "meta_meaning": "Life maintains dynamic equilibrium through balanced processes",
-        }
+        return _BIOLOGY_BALANCE
 
-    def get_genetic_code(self) -> dict[str, str]:
+    def get_genetic_code(self) -> Mapping[str, str]:
         """Get the standard genetic code (codon to amino acid)."""
-        return {
-            "UUU": "Phe",
-            "UUC": "Phe",
-            "UUA": "Leu",
-            "UUG": "Leu",
-            "UCU": "Ser",
-            "UCC": "Ser",
-            "UCA": "Ser",
-            "UCG": "Ser",
-            "UAU": "Tyr",
-            "UAC": "Tyr",
-            "UAA": "Stop",
-            "UAG": "Stop",
-            "UGU": "Cys",
-            "UGC": "Cys",
-            "UGA": "Stop",
-            "UGG": "Trp",
-            "CUU": "Leu",
-            "CUC": "Leu",
-            "CUA": "Leu",
-            "CUG": "Leu",
-            "CCU": "Pro",
-            "CCC": "Pro",
-            "CCA": "Pro",
-            "CCG": "Pro",
-            "CAU": "His",
-            "CAC": "His",
-            "CAA": "Gln",
-            "CAG": "Gln",
-            "CGU": "Arg",
-            "CGC": "Arg",
-            "CGA": "Arg",
-            "CGG": "Arg",
-            "AUU": "Ile",
-            "AUC": "Ile",
-            "AUA": "Ile",
-            "AUG": "Met",
-            "ACU": "Thr",
-            "ACC": "Thr",
-            "ACA": "Thr",
-            "ACG": "Thr",
-            "AAU": "Asn",
-            "AAC": "Asn",
-            "AAA": "Lys",
-            "AAG": "Lys",
-            "AGU": "Ser",
-            "AGC": "Ser",
-            "AGA": "Arg",
-            "AGG": "Arg",
-            "GUU": "Val",
-            "GUC": "Val",
-            "GUA": "Val",
-            "GUG": "Val",
-            "GCU": "Ala",
-            "GCC": "Ala",
-            "GCA": "Ala",
-            "GCG": "Ala",
-            "GAU": "Asp",
-            "GAC": "Asp",
-            "GAA": "Glu",
-            "GAG": "Glu",
-            "GGU": "Gly",
-            "GGC": "Gly",
-            "GGA": "Gly",
-            "GGG": "Gly",
-        }
+        return _GENETIC_CODE
+
+    def translate_rna(self, rna: str) -> list[str]:
+        """
+        Translate an mRNA sequence codon by codon using the standard genetic code.
+
+        Args:
+            rna: Sequence of U/C/A/G bases; a trailing partial codon is ignored
+
+        Returns:
+            Amino acid of each codon, including "Stop" codons
+
+        Raises:
+            ValueError: If the sequence contains anything other than U, C, A or G
+        """
+        bases = rna.encode("ascii", "replace").translate(_BASE_INDEX)
+        if bases and max(bases) > 3:
+            raise ValueError(f"Not an RNA sequence: {rna!r}")
+        names, ids = _AMINO_ACIDS, _CODON_TO_AA_ID
+        return [
+            names[ids[(first << 4) | (second << 2) | third]]
+            for first, second, third in zip(bases[0::3], bases[1::3], bases[2::3])
+        ]
 
 
 def create_biology_domain(
-    meta_equilibrium: MetaEquilibrium | None = None, initialize_all: bool = True
+    meta_equilibrium: MetaEquilibrium | None = None,
+    initialize_all: bool = True,
+    lazy: bool = False,
+    parallel: bool = False,
 ) -> BiologyDomain:
     """
     Factory function to create a fully initialized biology domain.
@@ -353,6 +369,8 @@ def create_biology_domain(
     Args:
         meta_equilibrium: Shared MetaEquilibrium instance
         initialize_all: Whether to initialize all content
+        lazy: Defer content sections until the domain is first queried
+        parallel: Load content sections concurrently on a thread pool
 
     Returns:
         Initialized BiologyDomain
@@ -360,10 +378,16 @@ def create_biology_domain(
     domain = BiologyDomain(meta_equilibrium)
 
     if initialize_all:
-        domain.initialize_branches()
-        domain.initialize_taxonomic_ranks()
-        domain.initialize_cell_components()
-        domain.initialize_macromolecules()
-        domain.initialize_biological_processes()
+        domain.load_sections(
+            (
+                domain.initialize_branches,
+                domain.initialize_taxonomic_ranks,
+                domain.initialize_cell_components,
+                domain.initialize_macromolecules,
+                domain.initialize_biological_processes,
+            ),
+            lazy=lazy,
+            parallel=parallel,
+        )
 
     return domain
@@ -5,16 +5,172 @@ Biophysics knowledge domain with META 50/50 equilibrium.
 Fundamental duality: Life/Physics (biological vs physical principles).
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from core.equilibrium import MetaEquilibrium
 from knowledge.domains.base import (
+    ConceptSpec,
     ConceptType,
     KnowledgeDomain,
-    RelationType,
+    expand_duality_pairs,
+    frozen_mapping,
+    section,
 )
 from models.domain import DomainType
 
+# Names are interned when the tables are built; Photosynthesis and DNA Replication
+# are also biology concepts, and Biomechanics is a sports science one.
+_BIOPHYSICS_PRINCIPLES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.PRINCIPLE, description, None)
+    for name, description in (
+        ("Physical Laws Apply", "Biology obeys physics"),
+        ("Structure Determines Function", "Molecular shape dictates activity"),
+        ("Energy Drives Life", "Thermodynamics governs biology"),
+        ("Quantitative Analysis", "Measure biological phenomena"),
+        ("Scale Matters", "Different physics at different scales"),
+        ("Dynamic Equilibrium", "Living systems maintain steady states"),
+        ("Information Flow", "Genetic and signaling information"),
+        ("Self-Organization", "Complex structures emerge"),
+    )
+)
+
+_BIOPHYSICS_BRANCHES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), concept_type, description, None)
+    for name, description, concept_type in (
+        ("Molecular Biophysics", "Molecular structure and dynamics", ConceptType.THEORY),
+        ("Membrane Biophysics", "Biological membranes", ConceptType.THEORY),
+        ("Structural Biology", "Macromolecular structures", ConceptType.THEORY),
+        ("Single Molecule Biophysics", "Individual molecule behavior", ConceptType.THEORY),
+        ("Computational Biophysics", "Simulations and modeling", ConceptType.THEORY),
+        ("Cellular Biophysics", "Physical cell properties", ConceptType.THEORY),
+        ("Neurobiophysics", "Neural signal physics", ConceptType.THEORY),
+        ("Biomechanics", "Mechanical properties of life", ConceptType.THEORY),
+        ("Photobiophysics", "Light-biology interactions", ConceptType.THEORY),
+        ("Medical Biophysics", "Clinical applications", ConceptType.THEORY),
+    )
+)
+
+_BIOPHYSICS_TECHNIQUES: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"category": category}),
+    )
+    for name, description, category in (
+        ("X-ray Crystallography", "Atomic structure", "Structural"),
+        ("NMR Spectroscopy", "Solution structure", "Structural"),
+        ("Cryo-EM", "Electron microscopy", "Imaging"),
+        ("Fluorescence", "Molecular probing", "Spectroscopy"),
+        ("AFM", "Surface imaging", "Microscopy"),
+        ("Optical Tweezers", "Force measurement", "Manipulation"),
+    )
+)
+
+_BIOPHYSICS_PHENOMENA: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"category": category}),
+    )
+    for name, description, category in (
+        ("Protein Folding", "3D structure formation", "Molecular"),
+        ("Ion Channel Gating", "Membrane transport", "Cellular"),
+        ("Molecular Motors", "Force generation", "Mechanical"),
+        ("DNA Replication", "Genetic copying", "Molecular"),
+        ("Photosynthesis", "Light energy capture", "Energy"),
+        ("Membrane Fusion", "Vesicle merging", "Cellular"),
+    )
+)
+
+_BIOPHYSICS_PAIRS = expand_duality_pairs(
+    (
+        ("Life", "Physics", "Biological vs physical"),
+        ("Structure", "Function", "Form vs activity"),
+        ("Molecular", "Cellular", "Molecule vs cell"),
+        ("Theory", "Experiment", "Model vs measurement"),
+        ("Static", "Dynamic", "Fixed vs moving"),
+        ("Equilibrium", "Non-equilibrium", "Stable vs driven"),
+        ("Deterministic", "Stochastic", "Predictable vs random"),
+        ("In Vitro", "In Vivo", "Test tube vs living"),
+        ("Single", "Ensemble", "One vs many"),
+        ("Local", "Global", "Site vs whole"),
+        ("Classical", "Quantum", "Newtonian vs quantum"),
+        ("Reversible", "Irreversible", "Undoable vs permanent"),
+        ("Active", "Passive", "Energy-using vs spontaneous"),
+        ("Ordered", "Disordered", "Structured vs random"),
+        ("Bound", "Free", "Attached vs loose"),
+        ("Native", "Denatured", "Folded vs unfolded"),
+        ("Hydrophobic", "Hydrophilic", "Water-fearing vs water-loving"),
+        ("Specific", "Non-specific", "Selective vs general"),
+        ("Fast", "Slow", "Quick vs gradual kinetics"),
+        ("Strong", "Weak", "High vs low affinity"),
+    ),
+    "Biophysics",
+)
+
+_FORCES_IN_BIOLOGY = frozen_mapping(
+    {
+        "electrostatic": "Charge-charge interactions",
+        "van_der_waals": "Weak attractive forces",
+        "hydrogen_bond": "H-bond donor-acceptor",
+        "hydrophobic": "Water exclusion effect",
+        "covalent": "Electron sharing",
+        "entropic": "Disorder-driven forces",
+    }
+)
+
+_BIOPHYSICS_BALANCE = frozen_mapping(
+    {
+        "concept": "Biophysics Equilibrium",
+        "dualities": {
+            "life_physics": {
+                "life": 50.0,
+                "physics": 50.0,
+                "meaning": "Biology and physics unified",
+            },
+            "structure_function": {
+                "structure": 50.0,
+                "function": 50.0,
+                "meaning": "Form and activity inseparable",
+            },
+            "theory_experiment": {
+                "theory": 50.0,
+                "experiment": 50.0,
+                "meaning": "Models and measurements complement",
+            },
+        },
+        "scale_balance": {
+            "molecular": 50.0,
+            "cellular": 50.0,
+            "description": "Different scales equally important",
+        },
+        "meta_meaning": "Biophysics demonstrates META 50/50 in life-physics synthesis",
+    }
+)
+
+_BIOPHYSICS_FUNDAMENTALS: tuple[str, ...] = (
+    "Protein",
+    "Membrane",
+    "DNA",
+    "Energy",
+    "Force",
+    "Diffusion",
+    "Conformation",
+    "Binding",
+    "Folding",
+    "Dynamics",
+    "Structure",
+    "Mechanics",
+    "Thermodynamics",
+    "Kinetics",
+    "Spectroscopy",
+)
+
 
 class BiophysicsDomain(KnowledgeDomain):
     """
@@ -51,252 +207,46 @@ class BiophysicsDomain(KnowledgeDomain):
 
     def _initialize_axioms(self) -> None:
         """Initialize fundamental biophysics principles."""
-        principles = [
-            (
-                "Physical Laws Apply",
-                "Biology obeys physics",
-            ),
-            (
-                "Structure Determines Function",
-                "Molecular shape dictates activity",
-            ),
-            (
-                "Energy Drives Life",
-                "Thermodynamics governs biology",
-            ),
-            (
-                "Quantitative Analysis",
-                "Measure biological phenomena",
-            ),
-            (
-                "Scale Matters",
-                "Different physics at different scales",
-            ),
-            (
-                "Dynamic Equilibrium",
-                "Living systems maintain steady states",
-            ),
-            (
-                "Information Flow",
-                "Genetic and signaling information",
-            ),
-            (
-                "Self-Organization",
-                "Complex structures emerge",
-            ),
-        ]
-
-        for name, description in principles:
-            self.create_concept(
-                name=name,
-                concept_type=ConceptType.PRINCIPLE,
-                description=description,
-                certainty=90,
-            )
+        self.create_concepts(_BIOPHYSICS_PRINCIPLES, certainty=90)
 
     def get_fundamental_concepts(self) -> list[str]:
         """Get fundamental biophysics concepts."""
-        return [
-            "Protein",
-            "Membrane",
-            "DNA",
-            "Energy",
-            "Force",
-            "Diffusion",
-            "Conformation",
-            "Binding",
-            "Folding",
-            "Dynamics",
-            "Structure",
-            "Mechanics",
-            "Thermodynamics",
-            "Kinetics",
-            "Spectroscopy",
-        ]
+        return list(_BIOPHYSICS_FUNDAMENTALS)
 
+    @section
     def initialize_branches(self) -> None:
         """Initialize major biophysics branches."""
-        branches = [
-            (
-                "Molecular Biophysics",
-                "Molecular structure and dynamics",
-                ConceptType.THEORY,
-            ),
-            (
-                "Membrane Biophysics",
-                "Biological membranes",
-                ConceptType.THEORY,
-            ),
-            (
-                "Structural Biology",
-                "Macromolecular structures",
-                ConceptType.THEORY,
-            ),
-            (
-                "Single Molecule Biophysics",
-                "Individual molecule behavior",
-                ConceptType.THEORY,
-            ),
-            (
-                "Computational Biophysics",
-                "Simulations and modeling",
-                ConceptType.THEORY,
-            ),
-            (
-                "Cellular Biophysics",
-                "Physical cell properties",
-                ConceptType.THEORY,
-            ),
-            (
-                "Neurobiophysics",
-                "Neural signal physics",
-                ConceptType.THEORY,
-            ),
-            (
-                "Biomechanics",
-                "Mechanical properties of life",
-                ConceptType.THEORY,
-            ),
-            (
-                "Photobiophysics",
-                "Light-biology interactions",
-                ConceptType.THEORY,
-            ),
-            (
-                "Medical Biophysics",
-                "Clinical applications",
-                ConceptType.THEORY,
-            ),
-        ]
-
-        for name, description, concept_type in branches:
-            self.create_concept(name, concept_type, description)
+        self.create_concepts(_BIOPHYSICS_BRANCHES)
 
+    @section
     def initialize_techniques(self) -> None:
         """Initialize biophysical techniques."""
-        techniques = [
-            ("X-ray Crystallography", "Atomic structure", "Structural"),
-            ("NMR Spectroscopy", "Solution structure", "Structural"),
-            ("Cryo-EM", "Electron microscopy", "Imaging"),
-            ("Fluorescence", "Molecular probing", "Spectroscopy"),
-            ("AFM", "Surface imaging", "Microscopy"),
-            ("Optical Tweezers", "Force measurement", "Manipulation"),
-        ]
-
-        for name, description, category in techniques:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["category"] = category
+        self.create_concepts(_BIOPHYSICS_TECHNIQUES)
 
+    @section
     def initialize_phenomena(self) -> None:
         """Initialize biophysical phenomena."""
-        phenomena = [
-            ("Protein Folding", "3D structure formation", "Molecular"),
-            ("Ion Channel Gating", "Membrane transport", "Cellular"),
-            ("Molecular Motors", "Force generation", "Mechanical"),
-            ("DNA Replication", "Genetic copying", "Molecular"),
-            ("Photosynthesis", "Light energy capture", "Energy"),
-            ("Membrane Fusion", "Vesicle merging", "Cellular"),
-        ]
-
-        for name, description, category in phenomena:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["category"] = category
+        self.create_concepts(_BIOPHYSICS_PHENOMENA)
 
+    @section
     def initialize_biophysics_pairs(self) -> None:
         """Initialize fundamental biophysics pairs with META 50/50 balance."""
-        pairs = [
-            ("Life", "Physics", "Biological vs physical"),
-            ("Structure", "Function", "Form vs activity"),
-            ("Molecular", "Cellular", "Molecule vs cell"),
-            ("Theory", "Experiment", "Model vs measurement"),
-            ("Static", "Dynamic", "Fixed vs moving"),
-            ("Equilibrium", "Non-equilibrium", "Stable vs driven"),
-            ("Deterministic", "Stochastic", "Predictable vs random"),
-            ("In Vitro", "In Vivo", "Test tube vs living"),
-            ("Single", "Ensemble", "One vs many"),
-            ("Local", "Global", "Site vs whole"),
-            ("Classical", "Quantum", "Newtonian vs quantum"),
-            ("Reversible", "Irreversible", "Undoable vs permanent"),
-            ("Active", "Passive", "Energy-using vs spontaneous"),
-            ("Ordered", "Disordered", "Structured vs random"),
-            ("Bound", "Free", "Attached vs loose"),
-            ("Native", "Denatured", "Folded vs unfolded"),
-            ("Hydrophobic", "Hydrophilic", "Water-fearing vs water-loving"),
-            ("Specific", "Non-specific", "Selective vs general"),
-            ("Fast", "Slow", "Quick vs gradual kinetics"),
-            ("Strong", "Weak", "High vs low affinity"),
-        ]
-
-        for positive, negative, description in pairs:
-            pos_concept = self.create_concept(
-                name=f"{positive} (Biophysics)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Positive pole: {description.split(' vs ')[0]}",
-            )
-            neg_concept = self.create_concept(
-                name=f"{negative} (Biophysics)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Negative pole: {description.split(' vs ')[1]}",
-            )
+        self.create_duality_pairs(_BIOPHYSICS_PAIRS)
 
-            self.create_relation(
-                pos_concept,
-                neg_concept,
-                RelationType.CONTRADICTS,
-                strength=50,
-            )
-
-    def get_forces_in_biology(self) -> dict[str, str]:
+    def get_forces_in_biology(self) -> Mapping[str, str]:
         """Get forces important in biology."""
-        return {
-            "electrostatic": "Charge-charge interactions",
-            "van_der_waals": "Weak attractive forces",
-            "hydrogen_bond": "H-bond donor-acceptor",
-            "hydrophobic": "Water exclusion effect",
-            "covalent": "Electron sharing",
-            "entropic": "Disorder-driven forces",
-        }
+        return _FORCES_IN_BIOLOGY
 
-    def demonstrate_biophysics_balance(self) -> dict[str, Any]:
+    def demonstrate_biophysics_balance(self) -> Mapping[str, Any]:
         """Demonstrate biophysics balance principles."""
-        return {
-            "concept": "Biophysics Equilibrium",
-            "dualities": {
-                "life_physics": {
-                    "life": 50.0,
-                    "physics": 50.0,
-                    "meaning": "Biology and physics unified",
-                },
-                "structure_function": {
-                    "structure": 50.0,
-                    "function": 50.0,
-                    "meaning": "Form and activity inseparable",
-                },
-                "theory_experiment": {
-                    "theory": 50.0,
-                    "experiment": 50.0,
-                    "meaning": "Models and measurements complement",
-                },
-            },
-            "scale_balance": {
-                "molecular": 50.0,
-                "cellular": 50.0,
-                "description": "Different scales equally important",
-            },
-            "meta_meaning": "Biophysics demonstrates META 50/50 in life-physics synthesis",
-        }
+        return _BIOPHYSICS_BALANCE
 
 
 def create_biophysics_domain(
-    meta_equilibrium: MetaEquilibrium | None = None, initialize_all: bool = True
+    meta_equilibrium: MetaEquilibrium | None = None,
+    initialize_all: bool = True,
+    lazy: bool = False,
+    parallel: bool = False,
 ) -> BiophysicsDomain:
     """
     Factory function to create a fully initialized biophysics domain.
@@ -304,6 +254,8 @@ def create_biophysics_domain(
     Args:
         meta_equilibrium: Shared MetaEquilibrium instance
         initialize_all: Whether to initialize all content
+        lazy: Defer content sections until the domain is first queried
+        parallel: Load content sections concurrently on a thread pool
 
     Returns:
         Initialized BiophysicsDomain
@@ -311,9 +263,15 @@ def create_biophysics_domain(
     domain = BiophysicsDomain(meta_equilibrium)
 
     if initialize_all:
-        domain.initialize_branches()
-        domain.initialize_techniques()
-        domain.initialize_phenomena()
-        domain.initialize_biophysics_pairs()
+        domain.load_sections(
+            (
+                domain.initialize_branches,
+                domain.initialize_techniques,
+                domain.initialize_phenomena,
+                domain.initialize_biophysics_pairs,
+            ),
+            lazy=lazy,
+            parallel=parallel,
+        )
 
     return domain
@@ -5,16 +5,166 @@ Biotechnology knowledge domain with META 50/50 equilibrium.
 Fundamental duality: Nature/Technology (biological vs engineered).
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from core.equilibrium import MetaEquilibrium
 from knowledge.domains.base import (
+    ConceptSpec,
     ConceptType,
     KnowledgeDomain,
-    RelationType,
+    expand_duality_pairs,
+    frozen_mapping,
+    section,
 )
 from models.domain import DomainType
 
+# Names are interned at import (Bioinformatics and Enzymes also name biology concepts).
+_BIOTECH_PRINCIPLES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.PRINCIPLE, description, None)
+    for name, description in (
+        ("Biological Basis", "All biotechnology built on biological understanding"),
+        ("Genetic Information", "DNA contains instructions for life"),
+        ("Protein Function", "Proteins are functional molecules"),
+        ("Cell as Factory", "Cells can be engineered production systems"),
+        ("Evolution as Tool", "Natural selection can be directed"),
+        ("Bioethics", "Ethical considerations guide applications"),
+        ("Safety First", "Biosafety essential in all work"),
+        ("Scale-Up Challenge", "Lab to production requires optimization"),
+    )
+)
+
+_BIOTECH_BRANCHES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), concept_type, description, None)
+    for name, description, concept_type in (
+        ("Medical Biotechnology", "Healthcare applications", ConceptType.THEORY),
+        ("Agricultural Biotechnology", "Crop and animal improvement", ConceptType.THEORY),
+        ("Industrial Biotechnology", "Manufacturing applications", ConceptType.THEORY),
+        ("Environmental Biotechnology", "Environmental applications", ConceptType.THEORY),
+        ("Marine Biotechnology", "Ocean-based applications", ConceptType.THEORY),
+        ("Genetic Engineering", "DNA modification", ConceptType.THEORY),
+        ("Synthetic Biology", "Designed biological systems", ConceptType.THEORY),
+        ("Bioinformatics", "Computational biology", ConceptType.THEORY),
+        ("Bioprocessing", "Production processes", ConceptType.THEORY),
+        ("Tissue Engineering", "Artificial tissues", ConceptType.THEORY),
+    )
+)
+
+_BIOTECH_TECHNIQUES: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"category": category}),
+    )
+    for name, description, category in (
+        ("PCR", "DNA amplification", "Molecular"),
+        ("CRISPR", "Gene editing", "Genetic"),
+        ("Fermentation", "Microbial production", "Bioprocess"),
+        ("Chromatography", "Protein purification", "Downstream"),
+        ("Sequencing", "DNA reading", "Analytical"),
+        ("Cell Culture", "Cell growth", "Cell biology"),
+    )
+)
+
+_BIOTECH_PRODUCTS: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.DEFINITION, description, MappingProxyType({"sector": sector}))
+    for name, description, sector in (
+        ("Vaccines", "Disease prevention", "Medical"),
+        ("Antibiotics", "Infection treatment", "Pharmaceutical"),
+        ("Enzymes", "Industrial catalysts", "Industrial"),
+        ("Biofuels", "Renewable energy", "Environmental"),
+        ("GM Crops", "Modified plants", "Agricultural"),
+        ("Biologics", "Protein drugs", "Therapeutic"),
+    )
+)
+
+_BIOTECH_PAIRS = expand_duality_pairs(
+    (
+        ("Nature", "Technology", "Biological vs engineered"),
+        ("Research", "Application", "Discovery vs use"),
+        ("Risk", "Benefit", "Danger vs advantage"),
+        ("Traditional", "Modern", "Classic vs new methods"),
+        ("In Vivo", "In Vitro", "Living vs lab"),
+        ("Upstream", "Downstream", "Production vs purification"),
+        ("Prokaryotic", "Eukaryotic", "Bacteria vs complex cells"),
+        ("Wild Type", "Mutant", "Natural vs modified"),
+        ("Expression", "Regulation", "Making vs controlling"),
+        ("Discovery", "Development", "Finding vs optimizing"),
+        ("Academic", "Industrial", "Research vs commercial"),
+        ("Small Scale", "Large Scale", "Lab vs production"),
+        ("Qualitative", "Quantitative", "Type vs amount"),
+        ("Targeted", "Random", "Precise vs undirected"),
+        ("Containment", "Release", "Controlled vs open"),
+        ("Patent", "Public", "Protected vs shared"),
+        ("Basic", "Applied", "Fundamental vs practical"),
+        ("Red", "Green", "Medical vs agricultural biotech"),
+        ("Natural", "Synthetic", "Found vs designed"),
+        ("Safety", "Efficacy", "Safe vs effective"),
+    ),
+    "Biotech",
+)
+
+_BIOTECH_COLORS = frozen_mapping(
+    {
+        "red": "Medical and pharmaceutical biotechnology",
+        "green": "Agricultural biotechnology",
+        "white": "Industrial biotechnology",
+        "blue": "Marine and aquatic biotechnology",
+        "grey": "Environmental biotechnology",
+        "gold": "Bioinformatics and computational",
+    }
+)
+
+_BIOTECH_BALANCE = frozen_mapping(
+    {
+        "concept": "Biotechnology Equilibrium",
+        "dualities": {
+            "nature_technology": {
+                "nature": 50.0,
+                "technology": 50.0,
+                "meaning": "Understanding biology to engineer solutions",
+            },
+            "risk_benefit": {
+                "risk": 50.0,
+                "benefit": 50.0,
+                "meaning": "Assessing both dangers and advantages",
+            },
+            "research_application": {
+                "research": 50.0,
+                "application": 50.0,
+                "meaning": "Discovery and use are complementary",
+            },
+        },
+        "development_balance": {
+            "upstream": 50.0,
+            "downstream": 50.0,
+            "description": "Production and purification equally important",
+        },
+        "meta_meaning": "Biotechnology demonstrates META 50/50 in nature-technology synthesis",
+    }
+)
+
+_BIOTECH_FUNDAMENTALS: tuple[str, ...] = (
+    "DNA",
+    "Gene",
+    "Protein",
+    "Cell",
+    "Enzyme",
+    "Fermentation",
+    "Cloning",
+    "Recombinant",
+    "Expression",
+    "Vector",
+    "Transgenic",
+    "Bioreactor",
+    "Downstream",
+    "Biosafety",
+    "Bioproduct",
+)
+
 
 class BiotechnologyDomain(KnowledgeDomain):
     """
@@ -51,252 +201,46 @@ class BiotechnologyDomain(KnowledgeDomain):
 
     def _initialize_axioms(self) -> None:
         """Initialize fundamental biotechnology principles."""
-        principles = [
-            (
-                "Biological Basis",
-                "All biotechnology built on biological understanding",
-            ),
-            (
-                "Genetic Information",
-                "DNA contains instructions for life",
-            ),
-            (
-                "Protein Function",
-                "Proteins are functional molecules",
-            ),
-            (
-                "Cell as Factory",
-                "Cells can be engineered production systems",
-            ),
-            (
-                "Evolution as Tool",
-                "Natural selection can be directed",
-            ),
-            (
-                "Bioethics",
-                "Ethical considerations guide applications",
-            ),
-            (
-                "Safety First",
-                "Biosafety essential in all work",
-            ),
-            (
-                "Scale-Up Challenge",
-                "Lab to production requires optimization",
-            ),
-        ]
-
-        for name, description in principles:
-            self.create_concept(
-                name=name,
-                concept_type=ConceptType.PRINCIPLE,
-                description=description,
-                certainty=85,
-            )
+        self.create_concepts(_BIOTECH_PRINCIPLES, certainty=85)
 
     def get_fundamental_concepts(self) -> list[str]:
         """Get fundamental biotechnology concepts."""
-        return [
-            "DNA",
-            "Gene",
-            "Protein",
-            "Cell",
-            "Enzyme",
-            "Fermentation",
-            "Cloning",
-            "Recombinant",
-            "Expression",
-            "Vector",
-            "Transgenic",
-            "Bioreactor",
-            "Downstream",
-            "Biosafety",
-            "Bioproduct",
-        ]
+        return list(_BIOTECH_FUNDAMENTALS)
 
+    @section
     def initialize_branches(self) -> None:
         """Initialize major biotechnology branches."""
-        branches = [
-            (
-                "Medical Biotechnology",
-                "Healthcare applications",
-                ConceptType.THEORY,
-            ),
-            (
-                "Agricultural Biotechnology",
-                "Crop and animal improvement",
-                ConceptType.THEORY,
-            ),
-            (
-                "Industrial Biotechnology",
-                "Manufacturing applications",
-                ConceptType.THEORY,
-            ),
-            (
-                "Environmental Biotechnology",
-                "Environmental applications",
-                ConceptType.THEORY,
-            ),
-            (
-                "Marine Biotechnology",
-                "Ocean-based applications",
-                ConceptType.THEORY,
-            ),
-            (
-                "Genetic Engineering",
-                "DNA modification",
-                ConceptType.THEORY,
-            ),
-            (
-                "Synthetic Biology",
-                "Designed biological systems",
-                ConceptType.THEORY,
-            ),
-            (
-                "Bioinformatics",
-                "Computational biology",
-                ConceptType.THEORY,
-            ),
-            (
-                "Bioprocessing",
-                "Production processes",
-                ConceptType.THEORY,
-            ),
-            (
-                "Tissue Engineering",
-                "Artificial tissues",
-                ConceptType.THEORY,
-            ),
-        ]
-
-        for name, description, concept_type in branches:
-            self.create_concept(name, concept_type, description)
+        self.create_concepts(_BIOTECH_BRANCHES)
 
+    @section
     def initialize_techniques(self) -> None:
         """Initialize biotechnology techniques."""
-        techniques = [
-            ("PCR", "DNA amplification", "Molecular"),
-            ("CRISPR", "Gene editing", "Genetic"),
-            ("Fermentation", "Microbial production", "Bioprocess"),
-            ("Chromatography", "Protein purification", "Downstream"),
-            ("Sequencing", "DNA reading", "Analytical"),
-            ("Cell Culture", "Cell growth", "Cell biology"),
-        ]
-
-        for name, description, category in techniques:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["category"] = category
+        self.create_concepts(_BIOTECH_TECHNIQUES)
 
+    @section
     def initialize_products(self) -> None:
         """Initialize biotechnology products."""
-        products = [
-            ("Vaccines", "Disease prevention", "Medical"),
-            ("Antibiotics", "Infection treatment", "Pharmaceutical"),
-            ("Enzymes", "Industrial catalysts", "Industrial"),
-            ("Biofuels", "Renewable energy", "Environmental"),
-            ("GM Crops", "Modified plants", "Agricultural"),
-            ("Biologics", "Protein drugs", "Therapeutic"),
-        ]
-
-        for name, description, sector in products:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["sector"] = sector
+        self.create_concepts(_BIOTECH_PRODUCTS)
 
+    @section
     def initialize_biotech_pairs(self) -> None:
         """Initialize fundamental biotechnology pairs with META 50/50 balance."""
-        pairs = [
-            ("Nature", "Technology", "Biological vs engineered"),
-            ("Research", "Application", "Discovery vs use"),
-            ("Risk", "Benefit", "Danger vs advantage"),
-            ("Traditional", "Modern", "Classic vs new methods"),
-            ("In Vivo", "In Vitro", "Living vs lab"),
-            ("Upstream", "Downstream", "Production vs purification"),
-            ("Prokaryotic", "Eukaryotic", "Bacteria vs complex cells"),
-            ("Wild Type", "Mutant", "Natural vs modified"),
-            ("Expression", "Regulation", "Making vs controlling"),
-            ("Discovery", "Development", "Finding vs optimizing"),
-            ("Academic", "Industrial", "Research vs commercial"),
-            ("Small Scale", "Large Scale", "Lab vs production"),
-            ("Qualitative", "Quantitative", "Type vs amount"),
-            ("Targeted", "Random", "Precise vs undirected"),
-            ("Containment", "Release", "Controlled vs open"),
-            ("Patent", "Public", "Protected vs shared"),
-            ("Basic", "Applied", "Fundamental vs practical"),
-            ("Red", "Green", "Medical vs agricultural biotech"),
-            ("Natural", "Synthetic", "Found vs designed"),
-            ("Safety", "Efficacy", "Safe vs effective"),
-        ]
-
-        for positive, negative, description in pairs:
-            pos_concept = self.create_concept(
-                name=f"{positive} (Biotech)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Positive pole: {description.split(' vs ')[0]}",
-            )
-            neg_concept = self.create_concept(
-                name=f"{negative} (Biotech)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Negative pole: {description.split(' vs ')[1]}",
-            )
+        self.create_duality_pairs(_BIOTECH_PAIRS)
 
-            self.create_relation(
-                pos_concept,
-                neg_concept,
-                RelationType.CONTRADICTS,
-                strength=50,
-            )
-
-    def get_color_classification(self) -> dict[str, str]:
+    def get_color_classification(self) -> Mapping[str, str]:
         """Get biotechnology color classification."""
-        return {
-            "red": "Medical and pharmaceutical biotechnology",
-            "green": "Agricultural biotechnology",
-            "white": "Industrial biotechnology",
-            "blue": "Marine and aquatic biotechnology",
-            "grey": "Environmental biotechnology",
-            "gold": "Bioinformatics and computational",
-        }
+        return _BIOTECH_COLORS
 
-    def demonstrate_biotech_balance(self) -> dict[str, Any]:
+    def demonstrate_biotech_balance(self) -> Mapping[str, Any]:
         """Demonstrate biotechnology balance principles."""
-        return {
-            "concept": "Biotechnology Equilibrium",
-            "dualities": {
-                "nature_technology": {
-                    "nature": 50.0,
-                    "technology": 50.0,
-                    "meaning": "Understanding biology to engineer solutions",
-                },
-                "risk_benefit": {
-                    "risk": 50.0,
-                    "benefit": 50.0,
-                    "meaning": "Assessing both dangers and advantages",
-                },
-                "research_application": {
-                    "research": 50.0,
-                    "application": 50.0,
-                    "meaning": "Discovery and use are complementary",
-                },
-            },
-            "development_balance": {
-                "upstream": 50.0,
-                "downstream": 50.0,
-                "description": "Production and purification equally important",
-            },
-            "meta_meaning": "Biotechnology demonstrates META 50/50 in nature-technology synthesis",
-        }
+        return _BIOTECH_BALANCE
 
 
 def create_biotechnology_domain(
-    meta_equilibrium: MetaEquilibrium | None = None, initialize_all: bool = True
+    meta_equilibrium: MetaEquilibrium | None = None,
+    initialize_all: bool = True,
+    lazy: bool = False,
+    parallel: bool = False,
 ) -> BiotechnologyDomain:
     """
     Factory function to create a fully initialized biotechnology domain.
@@ -304,6 +248,8 @@ def create_biotechnology_domain(
     Args:
         meta_equilibrium: Shared MetaEquilibrium instance
         initialize_all: Whether to initialize all content
+        lazy: Defer content sections until the domain is first queried
+        parallel: Load content sections concurrently on a thread pool
 
     Returns:
         Initialized BiotechnologyDomain
@@ -311,9 +257,15 @@ def create_biotechnology_domain(
     domain = BiotechnologyDomain(meta_equilibrium)
 
     if initialize_all:
-        domain.initialize_branches()
-        domain.initialize_techniques()
-        domain.initialize_products()
-        domain.initialize_biotech_pairs()
+        domain.load_sections(
+            (
+                domain.initialize_branches,
+                domain.initialize_techniques,
+                domain.initialize_products,
+                domain.initialize_biotech_pairs,
+            ),
+            lazy=lazy,
+            parallel=parallel,
+        )
 
     return domain
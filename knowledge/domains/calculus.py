@@ -5,16 +5,220 @@ Calculus knowledge domain with META 50/50 equilibrium.
 Fundamental duality: Derivative/Integral (rate vs accumulation).
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from core.equilibrium import MetaEquilibrium
 from knowledge.domains.base import (
+    ConceptSpec,
     ConceptType,
     KnowledgeDomain,
-    RelationType,
+    expand_duality_pairs,
+    frozen_mapping,
+    section,
 )
 from models.domain import DomainType
 
+_CALCULUS_THEOREMS: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.THEOREM, description, None)
+    for name, description in (
+        (
+            "Fundamental Theorem of Calculus",
+            "Differentiation and integration are inverse operations",
+        ),
+        ("Mean Value Theorem", "Continuous function attains its average rate at some point"),
+        ("Intermediate Value Theorem", "Continuous function takes all values between endpoints"),
+        ("Extreme Value Theorem", "Continuous function on closed interval has max and min"),
+        ("Chain Rule", "Derivative of composition is product of derivatives"),
+        ("L'Hôpital's Rule", "Indeterminate forms can be evaluated using derivatives"),
+        ("Taylor's Theorem", "Functions can be approximated by polynomial series"),
+        ("Squeeze Theorem", "Function bounded by converging functions also converges"),
+    )
+)
+
+_CALCULUS_BRANCHES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), concept_type, description, None)
+    for name, description, concept_type in (
+        ("Differential Calculus", "Study of rates of change and slopes", ConceptType.THEORY),
+        ("Integral Calculus", "Study of accumulation and areas", ConceptType.THEORY),
+        (
+            "Multivariable Calculus",
+            "Calculus of functions of multiple variables",
+            ConceptType.THEORY,
+        ),
+        ("Vector Calculus", "Calculus of vector fields", ConceptType.THEORY),
+        ("Differential Equations", "Equations involving derivatives", ConceptType.THEORY),
+        ("Real Analysis", "Rigorous foundation of calculus", ConceptType.THEORY),
+        ("Complex Analysis", "Calculus of complex-valued functions", ConceptType.THEORY),
+        ("Numerical Analysis", "Computational methods for calculus", ConceptType.THEORY),
+        ("Calculus of Variations", "Optimization of functionals", ConceptType.THEORY),
+        ("Stochastic Calculus", "Calculus for random processes", ConceptType.THEORY),
+    )
+)
+
+_DERIVATIVE_RULES: tuple[ConceptSpec, ...] = tuple(
+    (sys.intern(name), ConceptType.DEFINITION, description, MappingProxyType({"formula": formula}))
+    for name, formula, description in (
+        ("Power Rule", "d/dx[xⁿ] = nxⁿ⁻¹", "Polynomial differentiation"),
+        ("Product Rule", "d/dx[fg] = f'g + fg'", "Product of functions"),
+        ("Quotient Rule", "d/dx[f/g] = (f'g - fg')/g²", "Quotient of functions"),
+        ("Chain Rule", "d/dx[f(g(x))] = f'(g(x))g'(x)", "Composition"),
+        ("Sum Rule", "d/dx[f + g] = f' + g'", "Sum of functions"),
+        ("Constant Rule", "d/dx[c] = 0", "Constant function"),
+        ("Exponential Rule", "d/dx[eˣ] = eˣ", "Natural exponential"),
+        ("Logarithm Rule", "d/dx[ln(x)] = 1/x", "Natural logarithm"),
+    )
+)
+
+_INTEGRAL_TYPES: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"notation": notation}),
+    )
+    for name, notation, description in (
+        ("Indefinite Integral", "∫f(x)dx = F(x) + C", "Antiderivative"),
+        ("Definite Integral", "∫[a,b]f(x)dx = F(b) - F(a)", "Signed area"),
+        ("Improper Integral", "Integral with infinite limits", "Limit of definite"),
+        ("Line Integral", "∫C f ds", "Integral along curve"),
+        ("Surface Integral", "∫∫S f dS", "Integral over surface"),
+        ("Volume Integral", "∫∫∫V f dV", "Integral over volume"),
+        ("Contour Integral", "∮ f(z) dz", "Complex line integral"),
+    )
+)
+
+_CALCULUS_LIMITS: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"notation": notation}),
+    )
+    for name, notation, description in (
+        ("Limit at a Point", "lim(x→a) f(x) = L", "Approach value at point"),
+        ("One-Sided Limit", "lim(x→a⁺) or lim(x→a⁻)", "Approach from one side"),
+        ("Limit at Infinity", "lim(x→∞) f(x)", "Behavior as x grows"),
+        ("Infinite Limit", "lim(x→a) f(x) = ∞", "Unbounded growth"),
+        ("Epsilon-Delta", "|f(x) - L| < ε when |x - a| < δ", "Rigorous definition"),
+    )
+)
+
+_CALCULUS_SERIES: tuple[ConceptSpec, ...] = tuple(
+    (
+        sys.intern(name),
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"general_form": general_form}),
+    )
+    for name, general_form, description in (
+        ("Geometric Series", "Σarⁿ", "|r| < 1 for convergence"),
+        ("Harmonic Series", "Σ1/n", "Diverges"),
+        ("Power Series", "Σaₙxⁿ", "Within radius of convergence"),
+        ("Taylor Series", "Σf⁽ⁿ⁾(a)(x-a)ⁿ/n!", "Polynomial approximation"),
+        ("Maclaurin Series", "Taylor series at a=0", "Around origin"),
+        ("Fourier Series", "Σ(aₙcos(nx) + bₙsin(nx))", "Periodic functions"),
+    )
+)
+
+_CALCULUS_PAIRS = expand_duality_pairs(
+    (
+        ("Derivative", "Integral", "Rate vs accumulation"),
+        ("Differential", "Summation", "Infinitesimal vs total"),
+        ("Limit", "Infinity", "Approaching vs unbounded"),
+        ("Continuous", "Discontinuous", "Smooth vs broken"),
+        ("Convergent", "Divergent", "Approaching vs escaping"),
+        ("Maximum", "Minimum", "Peak vs valley"),
+        ("Increasing", "Decreasing", "Rising vs falling"),
+        ("Concave Up", "Concave Down", "Curving up vs down"),
+        ("Partial", "Total", "One vs all variables"),
+        ("Definite", "Indefinite", "Bounded vs unbounded integral"),
+        ("Instantaneous", "Average", "Moment vs interval"),
+        ("Local", "Global", "Nearby vs everywhere"),
+        ("Ordinary", "Partial", "One vs many variables"),
+        ("First Order", "Higher Order", "Simple vs complex"),
+        ("Linear", "Nonlinear", "Proportional vs not"),
+        ("Analytic", "Numerical", "Exact vs approximate"),
+        ("Bounded", "Unbounded", "Limited vs unlimited"),
+        ("Smooth", "Rough", "Differentiable vs not"),
+        ("Scalar", "Vector", "Magnitude vs direction"),
+        ("Real", "Complex", "One vs two dimensional"),
+    ),
+    "Calculus",
+)
+
+_CALCULUS_FUNDAMENTALS: tuple[str, ...] = (
+    "Limit",
+    "Derivative",
+    "Integral",
+    "Continuity",
+    "Convergence",
+    "Series",
+    "Function",
+    "Slope",
+    "Area",
+    "Rate",
+    "Differential",
+    "Antiderivative",
+    "Maximum",
+    "Minimum",
+    "Infinity",
+)
+
+_COMMON_DERIVATIVES = frozen_mapping(
+    {
+        "x^n": "n*x^(n-1)",
+        "e^x": "e^x",
+        "ln(x)": "1/x",
+        "sin(x)": "cos(x)",
+        "cos(x)": "-sin(x)",
+        "tan(x)": "sec²(x)",
+        "a^x": "a^x * ln(a)",
+    }
+)
+
+_COMMON_INTEGRALS = frozen_mapping(
+    {
+        "x^n": "x^(n+1)/(n+1) + C",
+        "e^x": "e^x + C",
+        "1/x": "ln|x| + C",
+        "sin(x)": "-cos(x) + C",
+        "cos(x)": "sin(x) + C",
+        "sec²(x)": "tan(x) + C",
+    }
+)
+
+_CALCULUS_BALANCE = frozen_mapping(
+    {
+        "concept": "Calculus Equilibrium",
+        "dualities": {
+            "derivative_integral": {
+                "differentiation": 50.0,
+                "integration": 50.0,
+                "meaning": "Inverse operations, fundamental theorem",
+            },
+            "rate_accumulation": {
+                "instantaneous_rate": 50.0,
+                "total_accumulation": 50.0,
+                "meaning": "Two views of the same function",
+            },
+            "local_global": {
+                "local_behavior": 50.0,
+                "global_behavior": 50.0,
+                "meaning": "Point properties vs overall properties",
+            },
+        },
+        "fundamental_theorem": {
+            "d_dx_integral": "Returns original function",
+            "integral_derivative": "Returns original function",
+            "description": "Perfect inverse relationship",
+        },
+        "meta_meaning": "Calculus demonstrates META 50/50 in derivative-integral duality",
+    }
+)
+
 
 class CalculusDomain(KnowledgeDomain):
     """
@@ -30,6 +234,8 @@ class CalculusDomain(KnowledgeDomain):
     - Maximum / Minimum
     """
 
+    __slots__ = ()
+
     def __init__(self, meta_equilibrium: MetaEquilibrium | None = None):
         super().__init__(
             name="Calculus",
@@ -51,304 +257,60 @@ class CalculusDomain(KnowledgeDomain):
 
     def _initialize_axioms(self) -> None:
         """Initialize fundamental calculus theorems as axioms."""
-        theorems = [
-            (
-                "Fundamental Theorem of Calculus",
-                "Differentiation and integration are inverse operations",
-            ),
-            (
-                "Mean Value Theorem",
-                "Continuous function attains its average rate at some point",
-            ),
-            (
-                "Intermediate Value Theorem",
-                "Continuous function takes all values between endpoints",
-            ),
-            (
-                "Extreme Value Theorem",
-                "Continuous function on closed interval has max and min",
-            ),
-            (
-                "Chain Rule",
-                "Derivative of composition is product of derivatives",
-            ),
-            (
-                "L'Hôpital's Rule",
-                "Indeterminate forms can be evaluated using derivatives",
-            ),
-            (
-                "Taylor's Theorem",
-                "Functions can be approximated by polynomial series",
-            ),
-            (
-                "Squeeze Theorem",
-                "Function bounded by converging functions also converges",
-            ),
-        ]
-
-        for name, description in theorems:
-            self.create_concept(
-                name=name,
-                concept_type=ConceptType.THEOREM,
-                description=description,
-                certainty=100,
-            )
+        self.create_concepts(_CALCULUS_THEOREMS, certainty=100)
 
     def get_fundamental_concepts(self) -> list[str]:
         """Get fundamental calculus concepts."""
-        return [
-            "Limit",
-            "Derivative",
-            "Integral",
-            "Continuity",
-            "Convergence",
-            "Series",
-            "Function",
-            "Slope",
-            "Area",
-            "Rate",
-            "Differential",
-            "Antiderivative",
-            "Maximum",
-            "Minimum",
-            "Infinity",
-        ]
+        return list(_CALCULUS_FUNDAMENTALS)
 
+    @section
     def initialize_branches(self) -> None:
         """Initialize major calculus branches."""
-        branches = [
-            (
-                "Differential Calculus",
-                "Study of rates of change and slopes",
-                ConceptType.THEORY,
-            ),
-            (
-                "Integral Calculus",
-                "Study of accumulation and areas",
-                ConceptType.THEORY,
-            ),
-            (
-                "Multivariable Calculus",
-                "Calculus of functions of multiple variables",
-                ConceptType.THEORY,
-            ),
-            (
-                "Vector Calculus",
-                "Calculus of vector fields",
-                ConceptType.THEORY,
-            ),
-            (
-                "Differential Equations",
-                "Equations involving derivatives",
-                ConceptType.THEORY,
-            ),
-            (
-                "Real Analysis",
-                "Rigorous foundation of calculus",
-                ConceptType.THEORY,
-            ),
-            (
-                "Complex Analysis",
-                "Calculus of complex-valued functions",
-                ConceptType.THEORY,
-            ),
-            (
-                "Numerical Analysis",
-                "Computational methods for calculus",
-                ConceptType.THEORY,
-            ),
-            (
-                "Calculus of Variations",
-                "Optimization of functionals",
-                ConceptType.THEORY,
-            ),
-            (
-                "Stochastic Calculus",
-                "Calculus for random processes",
-                ConceptType.THEORY,
-            ),
-        ]
-
-        for name, description, concept_type in branches:
-            self.create_concept(name, concept_type, description)
+        self.create_concepts(_CALCULUS_BRANCHES)
 
+    @section
     def initialize_derivative_rules(self) -> None:
         """Initialize differentiation rules."""
-        rules = [
-            ("Power Rule", "d/dx[xⁿ] = nxⁿ⁻¹", "Polynomial differentiation"),
-            ("Product Rule", "d/dx[fg] = f'g + fg'", "Product of functions"),
-            ("Quotient Rule", "d/dx[f/g] = (f'g - fg')/g²", "Quotient of functions"),
-            ("Chain Rule", "d/dx[f(g(x))] = f'(g(x))g'(x)", "Composition"),
-            ("Sum Rule", "d/dx[f + g] = f' + g'", "Sum of functions"),
-            ("Constant Rule", "d/dx[c] = 0", "Constant function"),
-            ("Exponential Rule", "d/dx[eˣ] = eˣ", "Natural exponential"),
-            ("Logarithm Rule", "d/dx[ln(x)] = 1/x", "Natural logarithm"),
-        ]
-
-        for name, formula, description in rules:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["formula"] = formula
+        self.create_concepts(_DERIVATIVE_RULES)
 
+    @section
     def initialize_integral_types(self) -> None:
         """Initialize integration types."""
-        integrals = [
-            ("Indefinite Integral", "∫f(x)dx = F(x) + C", "Antiderivative"),
-            ("Definite Integral", "∫[a,b]f(x)dx = F(b) - F(a)", "Signed area"),
-            ("Improper Integral", "Integral with infinite limits", "Limit of definite"),
-            ("Line Integral", "∫C f ds", "Integral along curve"),
-            ("Surface Integral", "∫∫S f dS", "Integral over surface"),
-            ("Volume Integral", "∫∫∫V f dV", "Integral over volume"),
-            ("Contour Integral", "∮ f(z) dz", "Complex line integral"),
-        ]
-
-        for name, notation, description in integrals:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["notation"] = notation
+        self.create_concepts(_INTEGRAL_TYPES)
 
+    @section
     def initialize_limits(self) -> None:
         """Initialize limit concepts."""
-        limits = [
-            ("Limit at a Point", "lim(x→a) f(x) = L", "Approach value at point"),
-            ("One-Sided Limit", "lim(x→a⁺) or lim(x→a⁻)", "Approach from one side"),
-            ("Limit at Infinity", "lim(x→∞) f(x)", "Behavior as x grows"),
-            ("Infinite Limit", "lim(x→a) f(x) = ∞", "Unbounded growth"),
-            ("Epsilon-Delta", "|f(x) - L| < ε when |x - a| < δ", "Rigorous definition"),
-        ]
-
-        for name, notation, description in limits:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["notation"] = notation
+        self.create_concepts(_CALCULUS_LIMITS)
 
+    @section
     def initialize_series(self) -> None:
         """Initialize series types."""
-        series = [
-            ("Geometric Series", "Σarⁿ", "|r| < 1 for convergence"),
-            ("Harmonic Series", "Σ1/n", "Diverges"),
-            ("Power Series", "Σaₙxⁿ", "Within radius of convergence"),
-            ("Taylor Series", "Σf⁽ⁿ⁾(a)(x-a)ⁿ/n!", "Polynomial approximation"),
-            ("Maclaurin Series", "Taylor series at a=0", "Around origin"),
-            ("Fourier Series", "Σ(aₙcos(nx) + bₙsin(nx))", "Periodic functions"),
-        ]
-
-        for name, form, property_desc in series:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=property_desc,
-            )
-            concept.metadata["general_form"] = form
+        self.create_concepts(_CALCULUS_SERIES)
 
+    @section
     def initialize_calculus_pairs(self) -> None:
         """Initialize fundamental calculus pairs with META 50/50 balance."""
-        pairs = [
-            ("Derivative", "Integral", "Rate vs accumulation"),
-            ("Differential", "Summation", "Infinitesimal vs total"),
-            ("Limit", "Infinity", "Approaching vs unbounded"),
-            ("Continuous", "Discontinuous", "Smooth vs broken"),
-            ("Convergent", "Divergent", "Approaching vs escaping"),
-            ("Maximum", "Minimum", "Peak vs valley"),
-            ("Increasing", "Decreasing", "Rising vs falling"),
-            ("Concave Up", "Concave Down", "Curving up vs down"),
-            ("Partial", "Total", "One vs all variables"),
-            ("Definite", "Indefinite", "Bounded vs unbounded integral"),
-            ("Instantaneous", "Average", "Moment vs interval"),
-            ("Local", "Global", "Nearby vs everywhere"),
-            ("Ordinary", "Partial", "One vs many variables"),
-            ("First Order", "Higher Order", "Simple vs complex"),
-            ("Linear", "Nonlinear", "Proportional vs not"),
-            ("Analytic", "Numerical", "Exact vs approximate"),
-            ("Bounded", "Unbounded", "Limited vs unlimited"),
-            ("Smooth", "Rough", "Differentiable vs not"),
-            ("Scalar", "Vector", "Magnitude vs direction"),
-            ("Real", "Complex", "One vs two dimensional"),
-        ]
-
-        for positive, negative, description in pairs:
-            pos_concept = self.create_concept(
-                name=f"{positive} (Calculus)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Positive pole: {description.split(' vs ')[0]}",
-            )
-            neg_concept = self.create_concept(
-                name=f"{negative} (Calculus)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Negative pole: {description.split(' vs ')[1]}",
-            )
-
-            self.create_relation(
-                pos_concept,
-                neg_concept,
-                RelationType.CONTRADICTS,
-                strength=50,
-            )
-
-    def get_common_derivatives(self) -> dict[str, str]:
+        self.create_duality_pairs(_CALCULUS_PAIRS)
+
+    def get_common_derivatives(self) -> Mapping[str, str]:
         """Get common derivative formulas."""
-        return {
-            "x^n": "n*x^(n-1)",
-            "e^x": "e^x",
-            "ln(x)": "1/x",
-            "sin(x)": "cos(x)",
-            "cos(x)": "-sin(x)",
-            "tan(x)": "sec²(x)",
-            "a^x": "a^x * ln(a)",
-        }
-
-    def get_common_integrals(self) -> dict[str, str]:
+        return _COMMON_DERIVATIVES
+
+    def get_common_integrals(self) -> Mapping[str, str]:
         """Get common integral formulas."""
-        return {
-            "x^n": "x^(n+1)/(n+1) + C",
-            "e^x": "e^x + C",
-            "1/x": "ln|x| + C",
-            "sin(x)": "-cos(x) + C",
-            "cos(x)": "sin(x) + C",
-            "sec²(x)": "tan(x) + C",
-        }
-
-    def demonstrate_calculus_balance(self) -> dict[str, Any]:
+        return _COMMON_INTEGRALS
+
+    def demonstrate_calculus_balance(self) -> Mapping[str, Any]:
         """Demonstrate calculus balance principles."""
-        return {
-            "concept": "Calculus Equilibrium",
-            "dualities": {
-                "derivative_integral": {
-                    "differentiation": 50.0,
-                    "integration": 50.0,
-                    "meaning": "Inverse operations, fundamental theorem",
-                },
-                "rate_accumulation": {
-                    "instantaneous_rate": 50.0,
-                    "total_accumulation": 50.0,
-                    "meaning": "Two views of the same function",
-                },
-                "local_global": {
-                    "local_behavior": 50.0,
-                    "global_behavior": 50.0,
-                    "meaning": "Point properties vs overall properties",
-                },
-            },
-            "fundamental_theorem": {
-                "d_dx_integral": "Returns original function",
-                "integral_derivative": "Returns original function",
-                "description": "Perfect inverse relationship",
-            },
-            "meta_meaning": "Calculus demonstrates META 50/50 in derivative-integral duality",
-        }
+        return _CALCULUS_BALANCE
 
 
 def create_calculus_domain(
-    meta_equilibrium: MetaEquilibrium | None = None, initialize_all: bool = True
+    meta_equilibrium: MetaEquilibrium | None = None,
+    initialize_all: bool = True,
+    lazy: bool = False,
+    parallel: bool = False,
 ) -> CalculusDomain:
     """
     Factory function to create a fully initialized calculus domain.
@@ -356,6 +318,8 @@ def create_calculus_domain(
     Args:
         meta_equilibrium: Shared MetaEquilibrium instance
         initialize_all: Whether to initialize all content
+        lazy: Defer content sections until the domain is first queried
+        parallel: Load content sections concurrently on a thread pool
 
     Returns:
         Initialized CalculusDomain
@@ -363,11 +327,17 @@ def create_calculus_domain(
     domain = CalculusDomain(meta_equilibrium)
 
     if initialize_all:
-        domain.initialize_branches()
-        domain.initialize_derivative_rules()
-        domain.initialize_integral_types()
-        domain.initialize_limits()
-        domain.initialize_series()
-        domain.initialize_calculus_pairs()
+        domain.load_sections(
+            (
+                domain.initialize_branches,
+                domain.initialize_derivative_rules,
+                domain.initialize_integral_types,
+                domain.initialize_limits,
+                domain.initialize_series,
+                domain.initialize_calculus_pairs,
+            ),
+            lazy=lazy,
+            parallel=parallel,
+        )
 
     return domain
@@ -5,16 +5,116 @@ Classics knowledge domain with META 50/50 equilibrium.
 Fundamental duality: Ancient/Modern (past vs present).
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from core.equilibrium import MetaEquilibrium
 from knowledge.domains.base import (
+    ConceptSpec,
     ConceptType,
     KnowledgeDomain,
-    RelationType,
+    expand_duality_pairs,
 )
 from models.domain import DomainType
 
+_CLASSICS_PRINCIPLES: tuple[ConceptSpec, ...] = tuple(
+    (name, ConceptType.PRINCIPLE, description, None)
+    for name, description in (
+        ("Classical Foundation", "Western civilization built on Greek and Roman foundations"),
+        ("Philological Method", "Close reading of texts reveals meaning"),
+        ("Historical Context", "Texts understood in their original context"),
+        ("Reception Studies", "Classical works continuously reinterpreted"),
+        ("Interdisciplinary Approach", "Combines literature, history, archaeology, philosophy"),
+        ("Language Mastery", "Latin and Greek essential for understanding"),
+        ("Material Culture", "Objects illuminate ancient life"),
+        ("Canonical Texts", "Certain works deemed foundational"),
+    )
+)
+
+_CLASSICS_BRANCHES: tuple[ConceptSpec, ...] = tuple(
+    (name, concept_type, description, None)
+    for name, description, concept_type in (
+        ("Greek Literature", "Ancient Greek texts", ConceptType.THEORY),
+        ("Latin Literature", "Ancient Roman texts", ConceptType.THEORY),
+        ("Ancient History", "Greek and Roman history", ConceptType.THEORY),
+        ("Classical Archaeology", "Material remains of antiquity", ConceptType.THEORY),
+        ("Classical Philosophy", "Greek and Roman philosophy", ConceptType.THEORY),
+        ("Ancient Art", "Greek and Roman visual arts", ConceptType.THEORY),
+        ("Papyrology", "Study of ancient papyri", ConceptType.THEORY),
+        ("Epigraphy", "Study of inscriptions", ConceptType.THEORY),
+        ("Numismatics", "Study of ancient coins", ConceptType.THEORY),
+        ("Reception Studies", "Classical tradition in later periods", ConceptType.THEORY),
+    )
+)
+
+_LITERARY_GENRES: tuple[ConceptSpec, ...] = tuple(
+    (
+        f"Classical {name}",
+        ConceptType.DEFINITION,
+        description,
+        MappingProxyType({"authors": authors}),
+    )
+    for name, authors, description in (
+        ("Epic", "Homer, Virgil", "Heroic narrative"),
+        ("Tragedy", "Aeschylus, Sophocles", "Dramatic suffering"),
+        ("Comedy", "Aristophanes, Plautus", "Humorous drama"),
+        ("Lyric Poetry", "Sappho, Horace", "Personal expression"),
+        ("History", "Herodotus, Livy", "Historical narrative"),
+        ("Oratory", "Demosthenes, Cicero", "Persuasive speech"),
+        ("Philosophy", "Plato, Seneca", "Philosophical dialogue"),
+    )
+)
+
+_CLASSICAL_PERIODS: tuple[ConceptSpec, ...] = tuple(
+    (name, ConceptType.DEFINITION, description, MappingProxyType({"dates": dates}))
+    for name, dates, description in (
+        ("Archaic Greece", "800-480 BCE", "Homer, early democracy"),
+        ("Classical Greece", "480-323 BCE", "Pericles, tragedy, philosophy"),
+        ("Hellenistic", "323-31 BCE", "Alexander's successors"),
+        ("Roman Republic", "509-27 BCE", "Expansion, Cicero"),
+        ("Roman Empire", "27 BCE-476 CE", "Augustus to fall"),
+        ("Late Antiquity", "284-600 CE", "Christianity, transition"),
+    )
+)
+
+_KEY_FIGURES: tuple[ConceptSpec, ...] = tuple(
+    (name, ConceptType.DEFINITION, description, MappingProxyType({"culture": culture}))
+    for name, culture, description in (
+        ("Homer", "Greek", "Epic poet, Iliad and Odyssey"),
+        ("Plato", "Greek", "Philosopher, dialogues"),
+        ("Aristotle", "Greek", "Philosopher, polymath"),
+        ("Virgil", "Roman", "Epic poet, Aeneid"),
+        ("Cicero", "Roman", "Orator, statesman"),
+        ("Augustus", "Roman", "First emperor"),
+    )
+)
+
+_CLASSICS_PAIRS = expand_duality_pairs(
+    (
+        ("Ancient", "Modern", "Past vs present"),
+        ("Greek", "Roman", "Hellas vs Rome"),
+        ("Text", "Material", "Literary vs archaeological"),
+        ("Elite", "Popular", "High vs common culture"),
+        ("Pagan", "Christian", "Old vs new religion"),
+        ("Republic", "Empire", "Senate vs emperor"),
+        ("Athens", "Sparta", "Democracy vs oligarchy"),
+        ("East", "West", "Orient vs Occident"),
+        ("Prose", "Poetry", "Unmetrical vs metrical"),
+        ("Myth", "History", "Legendary vs factual"),
+        ("Public", "Private", "Civic vs domestic"),
+        ("Male", "Female", "Men vs women in antiquity"),
+        ("Citizen", "Slave", "Free vs unfree"),
+        ("War", "Peace", "Conflict vs stability"),
+        ("Oral", "Written", "Spoken vs textual"),
+        ("Original", "Translation", "Greek/Latin vs vernacular"),
+        ("Primary", "Secondary", "Ancient vs modern source"),
+        ("Canonical", "Non-canonical", "Core vs marginal"),
+        ("Continuity", "Change", "Persistence vs transformation"),
+        ("Tradition", "Innovation", "Conservative vs new"),
+    ),
+    "Classics",
+)
+
 
 class ClassicsDomain(KnowledgeDomain):
     """
@@ -51,48 +151,7 @@ class ClassicsDomain(KnowledgeDomain):
 
     def _initialize_axioms(self) -> None:
         """Initialize fundamental classics principles."""
-        principles = [
-            (
-                "Classical Foundation",
-                "Western civilization built on Greek and Roman foundations",
-            ),
-            (
-                "Philological Method",
-                "Close reading of texts reveals meaning",
-            ),
-            (
-                "Historical Context",
-                "Texts understood in their original context",
-            ),
-            (
-                "Reception Studies",
-                "Classical works continuously reinterpreted",
-            ),
-            (
-                "Interdisciplinary Approach",
-                "Combines literature, history, archaeology, philosophy",
-            ),
-            (
-                "Language Mastery",
-                "Latin and Greek essential for understanding",
-            ),
-            (
-                "Material Culture",
-                "Objects illuminate ancient life",
-            ),
-            (
-                "Canonical Texts",
-                "Certain works deemed foundational",
-            ),
-        ]
-
-        for name, description in principles:
-            self.create_concept(
-                name=name,
-                concept_type=ConceptType.PRINCIPLE,
-                description=description,
-                certainty=85,
-            )
+        self.create_concepts(_CLASSICS_PRINCIPLES, certainty=85)
 
     def get_fundamental_concepts(self) -> list[str]:
         """Get fundamental classics concepts."""
@@ -116,163 +175,23 @@ class ClassicsDomain(KnowledgeDomain):
 
     def initialize_branches(self) -> None:
         """Initialize major classics branches."""
-        branches = [
-            (
-                "Greek Literature",
-                "Ancient Greek texts",
-                ConceptType.THEORY,
-            ),
-            (
-                "Latin Literature",
-                "Ancient Roman texts",
-                ConceptType.THEORY,
-            ),
-            (
-                "Ancient History",
-                "Greek and Roman history",
-                ConceptType.THEORY,
-            ),
-            (
-                "Classical Archaeology",
-                "Material remains of antiquity",
-                ConceptType.THEORY,
-            ),
-            (
-                "Classical Philosophy",
-                "Greek and Roman philosophy",
-                ConceptType.THEORY,
-            ),
-            (
-                "Ancient Art",
-                "Greek and Roman visual arts",
-                ConceptType.THEORY,
-            ),
-            (
-                "Papyrology",
-                "Study of ancient papyri",
-                ConceptType.THEORY,
-            ),
-            (
-                "Epigraphy",
-                "Study of inscriptions",
-                ConceptType.THEORY,
-            ),
-            (
-                "Numismatics",
-                "Study of ancient coins",
-                ConceptType.THEORY,
-            ),
-            (
-                "Reception Studies",
-                "Classical tradition in later periods",
-                ConceptType.THEORY,
-            ),
-        ]
-
-        for name, description, concept_type in branches:
-            self.create_concept(name, concept_type, description)
+        self.create_concepts(_CLASSICS_BRANCHES)
 
     def initialize_literary_genres(self) -> None:
         """Initialize classical literary genres."""
-        genres = [
-            ("Epic", "Homer, Virgil", "Heroic narrative"),
-            ("Tragedy", "Aeschylus, Sophocles", "Dramatic suffering"),
-            ("Comedy", "Aristophanes, Plautus", "Humorous drama"),
-            ("Lyric Poetry", "Sappho, Horace", "Personal expression"),
-            ("History", "Herodotus, Livy", "Historical narrative"),
-            ("Oratory", "Demosthenes, Cicero", "Persuasive speech"),
-            ("Philosophy", "Plato, Seneca", "Philosophical dialogue"),
-        ]
-
-        for name, authors, description in genres:
-            concept = self.create_concept(
-                name=f"Classical {name}",
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["authors"] = authors
+        self.create_concepts(_LITERARY_GENRES)
 
     def initialize_periods(self) -> None:
         """Initialize classical periods."""
-        periods = [
-            ("Archaic Greece", "800-480 BCE", "Homer, early democracy"),
-            ("Classical Greece", "480-323 BCE", "Pericles, tragedy, philosophy"),
-            ("Hellenistic", "323-31 BCE", "Alexander's successors"),
-            ("Roman Republic", "509-27 BCE", "Expansion, Cicero"),
-            ("Roman Empire", "27 BCE-476 CE", "Augustus to fall"),
-            ("Late Antiquity", "284-600 CE", "Christianity, transition"),
-        ]
-
-        for name, dates, characteristics in periods:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=characteristics,
-            )
-            concept.metadata["dates"] = dates
+        self.create_concepts(_CLASSICAL_PERIODS)
 
     def initialize_key_figures(self) -> None:
         """Initialize key classical figures."""
-        figures = [
-            ("Homer", "Greek", "Epic poet, Iliad and Odyssey"),
-            ("Plato", "Greek", "Philosopher, dialogues"),
-            ("Aristotle", "Greek", "Philosopher, polymath"),
-            ("Virgil", "Roman", "Epic poet, Aeneid"),
-            ("Cicero", "Roman", "Orator, statesman"),
-            ("Augustus", "Roman", "First emperor"),
-        ]
-
-        for name, culture, description in figures:
-            concept = self.create_concept(
-                name=name,
-                concept_type=ConceptType.DEFINITION,
-                description=description,
-            )
-            concept.metadata["culture"] = culture
+        self.create_concepts(_KEY_FIGURES)
 
     def initialize_classics_pairs(self) -> None:
         """Initialize fundamental classics pairs with META 50/50 balance."""
-        pairs = [
-            ("Ancient", "Modern", "Past vs present"),
-            ("Greek", "Roman", "Hellas vs Rome"),
-            ("Text", "Material", "Literary vs archaeological"),
-            ("Elite", "Popular", "High vs common culture"),
-            ("Pagan", "Christian", "Old vs new religion"),
-            ("Republic", "Empire", "Senate vs emperor"),
-            ("Athens", "Sparta", "Democracy vs oligarchy"),
-            ("East", "West", "Orient vs Occident"),
-            ("Prose", "Poetry", "Unmetrical vs metrical"),
-            ("Myth", "History", "Legendary vs factual"),
-            ("Public", "Private", "Civic vs domestic"),
-            ("Male", "Female", "Men vs women in antiquity"),
-            ("Citizen", "Slave", "Free vs unfree"),
-            ("War", "Peace", "Conflict vs stability"),
-            ("Oral", "Written", "Spoken vs textual"),
-            ("Original", "Translation", "Greek/Latin vs vernacular"),
-            ("Primary", "Secondary", "Ancient vs modern source"),
-            ("Canonical", "Non-canonical", "Core vs marginal"),
-            ("Continuity", "Change", "Persistence vs transformation"),
-            ("Tradition", "Innovation", "Conservative vs new"),
-        ]
-
-        for positive, negative, description in pairs:
-            pos_concept = self.create_concept(
-                name=f"{positive} (Classics)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Positive pole: {description.split(' vs ')[0]}",
-            )
-            neg_concept = self.create_concept(
-                name=f"{negative} (Classics)",
-                concept_type=ConceptType.DEFINITION,
-                description=f"Negative pole: {description.split(' vs ')[1]}",
-            )
-
-            self.create_relation(
-                pos_concept,
-                neg_concept,
-                RelationType.CONTRADICTS,
-                strength=50,
-            )
+        self.create_duality_pairs(_CLASSICS_PAIRS)
 
     def get_greek_philosophy_schools(self) -> dict[str, str]:
         """Get major Greek philosophy schools."""
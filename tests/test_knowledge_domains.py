@@ -5,19 +5,28 @@ Comprehensive tests for all knowledge domain implementations.
 Tests META 50/50 balance in each domain.
 """
 
+import copy
+import json
 import math
+import pickle
+import weakref
 from uuid import UUID
 
 import pytest
 
 from core.equilibrium import MetaEquilibrium
+from knowledge.domains.art import create_art_domain
 from knowledge.domains.base import (
     Concept,
     ConceptRelation,
     ConceptType,
     RelationType,
+    expand_duality_pairs,
+    frozen_mapping,
 )
 from knowledge.domains.biology import BiologyDomain, create_biology_domain
+from knowledge.domains.botany import create_botany_domain
+from knowledge.domains.calculus import create_calculus_domain
 from knowledge.domains.code import CodeDomain, create_code_domain
 from knowledge.domains.mathematics import MathematicsDomain, create_mathematics_domain
 from knowledge.domains.philosophy import PhilosophyDomain, create_philosophy_domain
@@ -54,6 +63,12 @@ class TestConcept:
         assert concept.uncertainty == 20.0
         assert concept.certainty + concept.uncertainty == 100.0
 
+    def test_concept_certainty_coerced_to_float(self):
+        """Test integer certainty is stored as a float."""
+        concept = Concept(name="Integer Certainty", certainty=80, uncertainty=20)
+        assert type(concept.certainty) is float
+        assert type(concept.uncertainty) is float
+
     def test_concept_adjust_certainty(self):
         """Test adjusting certainty."""
         concept = Concept(name="Adjustable", certainty=50.0)
@@ -74,6 +89,24 @@ class TestConcept:
         assert concept2.certainty == 0.0
         assert concept2.uncertainty == 100.0
 
+    def test_concept_meta_created_on_access(self):
+        """Test a concept's MetaEquilibrium is built lazily and then reused."""
+        concept = Concept(name="Lazy")
+        assert concept._meta is None
+        assert isinstance(concept.meta, MetaEquilibrium)
+        assert concept.meta is concept.meta
+
+    def test_concept_has_no_instance_dict(self):
+        """Test concepts and relations are slotted."""
+        assert not hasattr(Concept(name="Slotted"), "__dict__")
+        assert not hasattr(ConceptRelation(), "__dict__")
+
+    def test_concept_ids_unique(self):
+        """Test generated concept and relation ids are distinct UUIDs."""
+        ids = [Concept().id for _ in range(100)] + [ConceptRelation().id for _ in range(100)]
+        assert all(isinstance(concept_id, UUID) for concept_id in ids)
+        assert len(set(ids)) == len(ids)
+
     def test_concept_balance_property(self):
         """Test balance tuple property."""
         concept = Concept(name="Balanced", certainty=60.0, uncertainty=40.0)
@@ -520,6 +553,8 @@ class TestBiologyDomain:
         proteins = domain.get_concept_by_name("Proteins")
         assert proteins is not None
         assert "Enzymes" in proteins.metadata["examples"]
+        # Each concept gets its own list, not the shared spec tuple
+        assert isinstance(proteins.metadata["examples"], list)
 
     def test_biological_processes(self):
         """Test biological processes."""
@@ -542,6 +577,18 @@ class TestBiologyDomain:
         code = domain.get_genetic_code()
         assert code["AUG"] == "Met"  # Start codon
         assert code["UAA"] == "Stop"  # Stop codon
+        assert len(code) == 64
+        assert domain.get_genetic_code() is code
+
+    def test_translate_rna(self):
+        """Test codon-by-codon mRNA translation."""
+        domain = BiologyDomain()
+        assert domain.translate_rna("AUGUGGGCUUAAG") == ["Met", "Trp", "Ala", "Stop"]
+        assert domain.translate_rna("") == []
+        with pytest.raises(ValueError):
+            domain.translate_rna("AUGT")
+        with pytest.raises(ValueError):
+            domain.translate_rna("AUG\x00AA")
 
     def test_factory_function(self):
         """Test biology factory function."""
@@ -549,6 +596,14 @@ class TestBiologyDomain:
         assert domain.concept_count > 20
         assert domain.validate_balance()
 
+    def test_lazy_factory(self):
+        """Test lazy biology domain loads sections on first read."""
+        domain = create_biology_domain(lazy=True)
+        assert len(domain._concepts) == 8  # Principles only
+        kingdom = domain.get_concept_by_name("Kingdom")
+        assert len(domain.get_relations(kingdom.id)) == 2
+        assert domain.concept_count == create_biology_domain().concept_count
+
 
 # =============================================================================
 # Philosophy Domain Tests
@@ -652,6 +707,226 @@ class TestPhilosophyDomain:
         assert domain.validate_balance()
 
 
+# =============================================================================
+# Content Section Tests
+# =============================================================================
+
+
+class TestContentSections:
+    """Tests for run-once and lazily loaded content sections."""
+
+    def test_sections_run_once(self):
+        """Test re-running a section does not duplicate concepts."""
+        domain = create_art_domain()
+        count = domain.concept_count
+        domain.initialize_branches()
+        domain.initialize_art_pairs()
+        assert domain.concept_count == count
+
+    def test_lazy_sections_deferred(self):
+        """Test lazy factory defers sections until first read."""
+        domain = create_art_domain(lazy=True)
+        assert len(domain._concepts) == 8  # Principles only
+        assert domain.concept_count == create_art_domain().concept_count
+
+    def test_lazy_lookup_by_name(self):
+        """Test a name lookup miss loads deferred sections."""
+        domain = create_art_domain(lazy=True)
+        concept = domain.get_concept_by_name("Impressionism")
+        assert concept is not None
+        assert concept.metadata["period"] == "1860-1890"
+
+    def test_parallel_sections(self):
+        """Test parallel loading builds the same content as serial loading."""
+        serial = create_art_domain()
+        parallel = create_art_domain(parallel=True)
+        assert parallel.concept_count == serial.concept_count
+        assert len(parallel._relations) == len(serial._relations)
+
+    def test_parallel_sections_deterministic(self):
+        """Test parallel loading keeps serial concept order and first-match names."""
+        serial = create_calculus_domain()
+        parallel = create_calculus_domain(parallel=True)
+        assert [c.name for c in parallel._concepts.values()] == [
+            c.name for c in serial._concepts.values()
+        ]
+        assert [a.name for a in parallel._axioms] == [a.name for a in serial._axioms]
+        # "Chain Rule" is both a theorem and a composition technique
+        chain_rule = parallel.get_concept_by_name("Chain Rule")
+        assert chain_rule.concept_type == ConceptType.THEOREM
+
+    def test_lazy_parallel_rejected(self):
+        """Test lazy and parallel loading cannot be combined."""
+        with pytest.raises(ValueError):
+            create_art_domain(lazy=True, parallel=True)
+
+    def test_domain_copy_and_pickle(self):
+        """Test built domains (including parallel-loaded ones) copy and pickle."""
+        for domain in (create_art_domain(), create_art_domain(parallel=True)):
+            for clone in (copy.deepcopy(domain), pickle.loads(pickle.dumps(domain))):
+                assert clone.concept_count == domain.concept_count
+                assert len(clone._relations) == len(domain._relations)
+                assert clone.get_concept_by_name("Impressionism") is not None
+
+    def test_domain_weakref(self):
+        """Test domains with and without their own slots are weak-referenceable."""
+        for domain in (create_art_domain(initialize_all=False), create_calculus_domain()):
+            assert weakref.ref(domain)() is domain
+
+
+class TestDomainBuilders:
+    """Tests for the KnowledgeDomain concept/relation builder helpers."""
+
+    def test_create_duality_pairs(self):
+        """Test batched dualities match the expanded pair rows."""
+        domain = create_art_domain(initialize_all=False)
+        rows = expand_duality_pairs([("Light", "Shadow", "Bright vs dark")], "Test")
+        [(positive, negative)] = domain.create_duality_pairs(rows)
+        assert positive.name == "Light (Test)"
+        assert negative.description == "Negative pole: dark"
+        assert negative.concept_type == ConceptType.DEFINITION
+        [relation] = domain.get_relations(negative.id)
+        assert relation.source_id == positive.id
+        assert relation.relation_type == RelationType.CONTRADICTS
+        assert relation.strength == 50.0
+
+    def test_spec_metadata_copied_as_lists(self):
+        """Test tuple sequences in spec tables reach each concept as its own list."""
+        first, second = create_botany_domain(), create_botany_domain()
+        roots = first.get_concept_by_name("Root")
+        assert roots.metadata["types"] == ["Taproot", "Fibrous"]
+        roots.metadata["types"].append("Adventitious")
+        assert second.get_concept_by_name("Root").metadata["types"] == ["Taproot", "Fibrous"]
+        assert first.get_concept_by_name("Gymnosperms").metadata["examples"] == [
+            "Conifers",
+            "Cycads",
+            "Ginkgo",
+        ]
+
+    def test_expand_duality_pairs_without_suffix(self):
+        """Test pair rows keep the bare pole names when no suffix is given."""
+        [row] = expand_duality_pairs([("Acid", "Base", "Proton donor vs acceptor")])
+        assert row == ("Acid", "Base", "Positive pole: Proton donor", "Negative pole: acceptor")
+
+    def test_add_concepts(self):
+        """Test bulk-added concepts are owned and indexed by the domain."""
+        domain = create_art_domain(initialize_all=False)
+        concepts = domain.add_concepts(
+            Concept(name=f"Axiom {i}", concept_type=ConceptType.AXIOM) for i in range(3)
+        )
+        assert len(concepts) == 3
+        assert all(c.domain_id == domain.id for c in concepts)
+        assert domain.get_concept(concepts[0].id) is concepts[0]
+        assert domain.axiom_count == 3
+
+    def test_create_concepts(self):
+        """Test bulk-created concepts get their own copy of the row metadata."""
+        domain = create_art_domain(initialize_all=False)
+        metadata = {"period": "Ancient"}
+        first, second = domain.create_concepts(
+            [
+                ("Fresco", ConceptType.DEFINITION, "Paint on wet plaster", metadata),
+                ("Mosaic", ConceptType.THEORY, "Tiled image", None),
+            ],
+            certainty=70,
+        )
+        assert first.metadata == metadata
+        assert first.metadata is not metadata
+        assert second.metadata == {}
+        assert second.concept_type == ConceptType.THEORY
+        assert first.certainty == pytest.approx(70)
+        assert domain.get_concept_by_name("Mosaic") is second
+
+    def test_add_relations(self):
+        """Test bulk-added relations are found from either end."""
+        domain = create_art_domain(initialize_all=False)
+        a, b, c = domain.create_concepts(
+            (name, ConceptType.DEFINITION, "", None) for name in ("A", "B", "C")
+        )
+        relations = domain.add_relations(
+            [
+                ConceptRelation(source_id=a.id, target_id=b.id),
+                ConceptRelation(source_id=b.id, target_id=c.id),
+            ]
+        )
+        assert len(relations) == 2
+        assert len(domain.get_relations(b.id)) == 2
+        assert domain.get_relations(c.id) == [relations[1]]
+        domain.add_relation(relations[0])
+        assert len(domain.get_relations(a.id)) == 1
+
+    def test_create_relations(self):
+        """Test one relation is created per edge, from concepts or ids."""
+        domain = create_art_domain(initialize_all=False)
+        a, b, c = domain.create_concepts(
+            (name, ConceptType.DEFINITION, "", None) for name in ("A", "B", "C")
+        )
+        relations = domain.create_relations(
+            [(a, b), (b.id, c.id)], RelationType.SPECIALIZES, strength=100
+        )
+        assert [(r.source_id, r.target_id) for r in relations] == [(a.id, b.id), (b.id, c.id)]
+        assert all(r.relation_type == RelationType.SPECIALIZES for r in relations)
+        assert all(r.strength == 100 for r in relations)
+        assert len(domain.get_relations(b.id)) == 2
+
+    def test_duplicate_relations_ignored(self):
+        """Test a second relation with the same ends, type and direction is rejected."""
+        domain = create_art_domain(initialize_all=False)
+        a, b = domain.create_concepts(
+            (name, ConceptType.DEFINITION, "", None) for name in ("A", "B")
+        )
+        assert domain.add_relation(ConceptRelation(source_id=a.id, target_id=b.id))
+        assert not domain.add_relation(ConceptRelation(source_id=a.id, target_id=b.id))
+        assert domain.add_relation(ConceptRelation(source_id=b.id, target_id=a.id))
+        assert domain.add_relation(
+            ConceptRelation(source_id=a.id, target_id=b.id, bidirectional=True)
+        )
+        assert not domain.add_relation(
+            ConceptRelation(source_id=b.id, target_id=a.id, bidirectional=True)
+        )
+        assert len(domain.get_relations(a.id)) == 3
+
+    def test_create_relation_returns_stored(self):
+        """Test create_relation returns the existing relation for a duplicate edge."""
+        domain = create_art_domain(initialize_all=False)
+        a, b = domain.create_concepts(
+            (name, ConceptType.DEFINITION, "", None) for name in ("A", "B")
+        )
+        first = domain.create_relation(a, b, RelationType.SUPPORTS)
+        assert domain.create_relation(a.id, b.id, RelationType.SUPPORTS, strength=80) is first
+        assert domain.get_relations(a.id) == [first]
+
+    def test_stats_count_types(self):
+        """Test per-type counts cover both single and bulk additions."""
+        domain = create_art_domain(initialize_all=False)
+        domain.create_concept("Fresco", ConceptType.THEORY)
+        domain.create_concepts([("Mosaic", ConceptType.THEORY, "", None)])
+        stats = domain.get_domain_stats()
+        assert stats["concepts_by_type"] == {"principle": 8, "theory": 2}
+        assert sum(stats["concepts_by_type"].values()) == stats["concepts"]
+
+    def test_concept_by_name_first_match(self):
+        """Test name lookup is case-insensitive and keeps the first concept."""
+        domain = create_art_domain(initialize_all=False)
+        first = domain.create_concept("Glaze", ConceptType.DEFINITION, "Ceramic coating")
+        domain.create_concept("glaze", ConceptType.DEFINITION, "Thin paint layer")
+        assert domain.get_concept_by_name("GLAZE") is first
+        assert domain.get_concept_by_name("Varnish") is None
+
+    def test_frozen_mapping(self):
+        """Test frozen mappings reject changes but stay plain-dict compatible."""
+        frozen = frozen_mapping({"outer": {"inner": 1}})
+        with pytest.raises(TypeError):
+            frozen["outer"] = {}
+        with pytest.raises(TypeError):
+            frozen["outer"]["inner"] = 2
+        assert isinstance(frozen, dict)
+        assert json.loads(json.dumps(frozen)) == {"outer": {"inner": 1}}
+        copied = copy.deepcopy(frozen)
+        copied["outer"]["inner"] = 2
+        assert frozen["outer"]["inner"] == 1
+
+
 # =============================================================================
 # Cross-Domain Integration Tests
 # =============================================================================
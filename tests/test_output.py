@@ -9,6 +9,7 @@ from datetime import datetime
 
 import pytest
 
+from knowledge.domains.art import ArtDomain
 from output.display import (
     BufferedDisplay,
     ConsoleDisplay,
@@ -183,6 +184,17 @@ class TestJsonFormatter:
         z_pos = output.content.find('"z"')
         assert a_pos < m_pos < z_pos
 
+    def test_format_domain_balance(self):
+        """Test a domain's shared balance demonstration formats as a JSON object."""
+        formatter = JsonFormatter()
+        balance = ArtDomain().demonstrate_art_balance()
+        output = formatter.format_data(balance)
+
+        parsed = json.loads(output.content)
+        assert parsed == json.loads(json.dumps(balance))
+        assert parsed["concept"] == "Art Equilibrium"
+        assert isinstance(parsed["dualities"], dict)
+
 
 # =============================================================================
 # MarkdownFormatter Tests